@@ -12,6 +12,7 @@ from .src.library.data.DictList import DictList
 from .src.library.data.OrderedDictList import OrderedDictList
 from .src.library.data.HandledDictList import HandledDictList
 from .src.library.data.LinkedDictList import LinkedDictList
+from .src.library.data.Query import Query
 from .src.library.database.MongoDB import MongoDB
 from .src.library.trade.KRX import KRX
 from .src.library.trade.Upbit import Upbit
@@ -23,6 +24,7 @@ __all__.extend(["ATTR", "LOOP", "CALL", "RAISE"])
 __all__.extend(["Lib", "Math", "OS", "Interface", "Interval", "Process", "Trace"])
 __all__.extend(["Datetime"])
 __all__.extend(["DictList", "OrderedDictList", "HandledDictList", "LinkedDictList"])
+__all__.extend(["Query"])
 __all__.extend(["MongoDB"])
 __all__.extend(["KRX", "Upbit"])
 __all__.extend(["Main"])
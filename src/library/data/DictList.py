@@ -1,14 +1,42 @@
 from typing import Optional, Union, List, Dict, Any, Iterable, Iterator, overload
+from typing import Callable, Tuple, TYPE_CHECKING
 from enum import Enum
-from collections import OrderedDict
-from functools import reduce
+from array import array
+from collections import OrderedDict, deque
+from itertools import islice, compress, repeat
+from re import compile
+from sys import byteorder
+from struct import pack, unpack_from
+from mmap import mmap, ACCESS_READ
+from datetime import datetime, timedelta
+from math import sqrt
+from operator import gt, lt
 from pickle import load as load_pickle, dump as dump_pickle
-from json import load as load_json, dump as dump_json
+from pickle import loads as loads_pickle, dumps as dumps_pickle
+from json import load as load_json, dump as dump_json, JSONDecoder, JSONDecodeError
+from json import loads as loads_json, dumps as dumps_json
 from csv import reader as read_csv, DictWriter
 
 from ..lib.macro import ATTR, KWARGS, KWARGS_STR, LOOP
 from ..lib.Trace import Trace
 from ..lib.OS import OS
+from ..lib.Math import Math
+
+if TYPE_CHECKING:
+    from .Query import Query
+
+
+class _Missing:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return "MISSING"
 
 
 class DictList:
@@ -16,25 +44,112 @@ class DictList:
         DICTLIST = "DictList"
         CSV = "csv"
         JSON = "json"
+        JSONL = "jsonl"
+        COLUMNS = "columns"
+
+    MISSING = _Missing()
+
+    _FRAME = 4096  # elements per pickle frame, so files can be streamed
+
+    class Group:
+        def __init__(
+            self,
+            data: "DictList",
+            keys: List[str],
+            functions: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+        ) -> None:
+            self._data = data
+            self._keys = keys
+            self._functions = functions if functions else {}
+
+        def agg(
+            self,
+            aggregations: Dict[str, Union[str, Callable, Tuple[str, Any]]],
+        ) -> "DictList":
+            targets = _get_targets(aggregations)
+            accumulators = [_get_accumulator(function) for _, _, function in targets]
+
+            keys = self._keys + [key for _, key, _ in targets]
+            data = self._data._data
+            if self._functions or not isinstance(data, _Columns):
+                rows = (
+                    tuple(e.get(k, DictList.MISSING) for k in keys)
+                    + tuple(f(e) for f in self._functions.values())
+                    for e in data
+                )
+
+            else:
+                columns = data.get_keys()
+                rows = zip(
+                    *(
+                        (
+                            data.get_column(k)
+                            if k in columns
+                            else repeat(DictList.MISSING, len(data))
+                        )
+                        for k in keys
+                    )
+                )
+
+            groups: Dict[Tuple, List] = {}
+            width, count = len(self._keys), len(targets)
+            group_keys = self._keys + list(self._functions.keys())
+
+            for row in rows:
+                group = row[:width] + row[width + count :]
+                if (states := groups.get(group)) is None:
+                    states = groups[group] = [a() for a in accumulators]
+
+                for state, value in zip(states, row[width : width + count]):
+                    if value is not DictList.MISSING:
+                        state.add(value)
+
+            return DictList(
+                [
+                    {
+                        **{
+                            k: v
+                            for k, v in zip(group_keys, group)
+                            if v is not DictList.MISSING
+                        },
+                        **{
+                            output: state.get()
+                            for (output, _, _), state in zip(targets, states)
+                        },
+                    }
+                    for group, states in groups.items()
+                ]
+            )
 
     def __init__(
         self,
         default: Optional[Union[str, List[Dict[str, Any]]]] = None,
         file_type: Optional[Union[FileType, str]] = None,
         name: Optional[str] = None,
+        indexes: Optional[List[str]] = None,
+        columnar: bool = False,
     ) -> None:
         self._name = name
         self._trace = ATTR(DictList, "trace", lambda: Trace("core"))
 
+        if columnar and indexes:
+            self._check_index()
+
+        self._indexes: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {
+            key: {} for key in (indexes if indexes else [])
+        }
+        self._journal: Optional[Dict[str, Any]] = None
+
         if default is None:
-            self._data = []
+            self._data = _Columns() if columnar else []
 
         elif isinstance(default, str):
-            self._data = []
+            self._data = _Columns() if columnar else []
             self.read(default, **KWARGS(file_type=file_type))
 
         else:
-            self._data = default
+            self._data = _Columns(default) if columnar else default
+            self._add_indexes(default)
 
     def __len__(self) -> int:
         return len(self._data)
@@ -56,6 +171,13 @@ class DictList:
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         return self._data[arg]
 
+    @property
+    def columnar(self) -> bool:
+        return isinstance(self._data, _Columns)
+
+    def _get_list(self) -> List[Dict[str, Any]]:
+        return self._data if isinstance(self._data, list) else list(self._data)
+
     def __str__(self) -> str:
         attrs = KWARGS_STR(len=len(self._data), name=self._name)
         return f"{self.__class__.__name__}({attrs})"
@@ -83,12 +205,12 @@ class DictList:
         /,
     ) -> Union[Dict[str, Any], None]:
         if isinstance(arg1, str):  # arg1: key, arg2: value
-            for e in self._data:
+            for e in self._select({arg1: arg2}):
                 if arg1 in e and e[arg1] == arg2:
                     return e
 
         else:  # arg1: queries: Dict[key, value]
-            for e in self._data:
+            for e in self._select(arg1):
                 if all(k in e and e[k] == v for k, v in arg1.items()):
                     return e
 
@@ -99,17 +221,19 @@ class DictList:
         /,
     ) -> List[Dict[str, Any]]:
         if isinstance(arg1, str):  # arg1: key, arg2: value
-            return [e for e in self._data if arg1 in e and e[arg1] == arg2]
+            return [
+                e for e in self._select({arg1: arg2}) if arg1 in e and e[arg1] == arg2
+            ]
 
         elif isinstance(arg1, dict):  # arg1: queries: Dict[str, Any]
             return [
                 e
-                for e in self._data
+                for e in self._select(arg1)
                 if all(k in e and e[k] == v for k, v in arg1.items())
             ]
 
         else:
-            return self._data
+            return self._get_list()
 
     def get_filtered_data(
         self,
@@ -120,16 +244,21 @@ class DictList:
         include: Optional[Iterable] = None,
         exclude: Optional[Iterable] = None,
     ) -> List[Dict[str, Any]]:
-        return [
-            e
-            for e in self._data
-            if (
-                (start is None or e[key] >= start)
-                and (end is None or e[key] <= end)
-                and (include is None or e[key] in include)
-                and (exclude is None or e[key] not in exclude)
-            )
-        ]
+        is_valid = lambda value: (
+            (start is None or value >= start)
+            and (end is None or value <= end)
+            and (include is None or value in include)
+            and (exclude is None or value not in exclude)
+        )
+
+        if isinstance(self._data, _Columns):
+            return [
+                self._data[i]
+                for i, value in enumerate(self._data.get_column(key))
+                if is_valid(value)
+            ]
+
+        return [e for e in self._data if is_valid(e[key])]
 
     def get_values(
         self,
@@ -137,7 +266,11 @@ class DictList:
         overlap: bool = True,
         sort: bool = False,
     ) -> List[Any]:
-        values = [e[key] for e in self._data if key in e]
+        if isinstance(self._data, _Columns):
+            values = self._data.get_values(key)
+
+        else:
+            values = [e[key] for e in self._data if key in e]
 
         if not overlap:
             values = list(OrderedDict.fromkeys(values))
@@ -147,88 +280,1032 @@ class DictList:
 
         return values
 
+    def query(self, query: "Query") -> List[Dict[str, Any]]:
+        queries = query.get_equalities()
+        if any(key in self._indexes for key in queries):
+            return [e for e in self._select(queries) if query.match(e)]
+
+        columns = {}
+
+        def get_column(key: str) -> Iterable[Any]:
+            if key not in columns:
+                if not isinstance(self._data, _Columns):
+                    columns[key] = [e.get(key, self.MISSING) for e in self._data]
+
+                elif key in self._data.get_keys():
+                    columns[key] = self._data.get_column(key)
+
+                else:
+                    columns[key] = [self.MISSING] * len(self._data)
+
+            return columns[key]
+
+        mask = query.mask(get_column, len(self._data))
+
+        if isinstance(self._data, _Columns):
+            return [self._data[i] for i in compress(range(len(self._data)), mask)]
+
+        return list(compress(self._data, mask))
+
+    def group_by(
+        self,
+        keys: Union[str, List[str]],
+        functions: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+    ) -> "DictList.Group":
+        return self.Group(
+            self,
+            [keys] if isinstance(keys, str) else keys,
+            **KWARGS(functions=functions),
+        )
+
+    def get_column(self, key: str) -> Union[array, memoryview, List[Any]]:
+        if not isinstance(self._data, _Columns):
+            err = f"{self.__class__.__name__} is not columnar"
+            self._trace.critical(err)
+            raise TypeError(err)
+
+        if isinstance(column := self._data.get_column(key), _DatetimeColumn):
+            return list(column)
+
+        return column
+
+    def _check_index(self) -> None:
+        # index buckets hold row dicts, which columnar storage does not keep
+        err = "Indexes are not supported on columnar data"
+        self._trace.critical(err)
+        raise TypeError(err)
+
+    def create_index(self, key: str) -> None:
+        if self.columnar:
+            self._check_index()
+
+        self._indexes[key] = {}
+        self._add_indexes(self._data, [key])
+
+    def drop_index(self, key: str) -> None:
+        self._indexes.pop(key, None)
+
+    def get_indexes(self) -> List[str]:
+        return list(self._indexes.keys())
+
+    def _select(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
+        candidates = None
+        for key, value in queries.items():
+            if key in self._indexes:
+                try:
+                    bucket = self._indexes[key].get(value, [])
+
+                except TypeError:  # unhashable value
+                    continue
+
+                if candidates is None or len(bucket) < len(candidates):
+                    candidates = bucket
+
+        return self._data if candidates is None else candidates
+
+    def _add_indexes(
+        self,
+        data: Iterable[Dict[str, Any]],
+        keys: Optional[List[str]] = None,
+    ) -> None:
+        for key in self._indexes if keys is None else keys:
+            index = self._indexes[key]
+            for e in data:
+                if key in e:
+                    try:
+                        index.setdefault(e[key], []).append(e)
+
+                    except TypeError:  # unhashable value
+                        pass
+
+    def _remove_indexes(self, data: Iterable[Dict[str, Any]]) -> None:
+        for key, index in self._indexes.items():
+            for e in data:
+                if key in e:
+                    try:
+                        bucket = index.get(e[key])
+
+                    except TypeError:  # unhashable value
+                        continue
+
+                    if bucket is None:
+                        continue
+
+                    i = next((i for i, b in enumerate(bucket) if b is e), None)
+                    if i is None:
+                        i = next((i for i, b in enumerate(bucket) if b == e), None)
+
+                    if i is not None:
+                        del bucket[i]
+
+                    if not bucket:
+                        del index[e[key]]
+
+    def _build_indexes(self) -> None:
+        LOOP(index.clear() for index in self._indexes.values())
+        self._add_indexes(self._data)
+
     def append(self, element: Dict[str, Any]) -> None:
         self._data.append(element)
+        self._add_indexes((element,))
 
     def extend(self, data: List[Dict[str, Any]]) -> None:
+        data = list(data)  # consumed more than once below
+
         self._data.extend(data)
+        self._add_indexes(data)
 
     def insert(self, element: Dict[str, Any], *, index: int = 0) -> None:
         self._data.insert(index, element)
+        self._journal = None
+        if self._indexes:
+            self._build_indexes()
 
     def remove(self, element: Dict[str, Any]) -> None:
-        self._data.remove(element)
+        self._remove_indexes((self._data.pop(self._data.index(element)),))
+        self._journal = None
 
     def pop(self, index: int = 0) -> Dict[str, Any]:
-        return self._data.pop(index)
+        element = self._data.pop(index)
+        self._remove_indexes((element,))
+        self._journal = None
+        return element
 
     def clear(self) -> None:
         self._data.clear()
+        self._journal = None
+        LOOP(index.clear() for index in self._indexes.values())
+
+    def evict(self, count: int) -> None:
+        if (count := min(count, len(self._data))) <= 0:
+            return
+
+        if self._indexes:
+            self._remove_indexes(self._data[:count])
+
+        if isinstance(self._data, list):
+            del self._data[:count]
+
+        else:
+            self._data.evict(count)
+
+        self._journal = None
+
+    @classmethod
+    def _get_file_type(
+        cls,
+        file: str,
+        file_type: Optional[Union[FileType, str]] = None,
+    ) -> FileType:
+        if file_type is None:
+            return cls.FileType(OS.get_extension(file))
+
+        return cls.FileType(file_type)
+
+    @classmethod
+    def iter_file(
+        cls,
+        file: str,
+        file_type: Optional[Union[FileType, str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        file_type = cls._get_file_type(file, file_type)
+
+        if not OS.is_exist(file):
+            return
+
+        if file_type == cls.FileType.COLUMNS:
+            yield from cls._iter_chunks(iter(_Columns.open(file)), chunk_size)
+            return
+
+        mode, encoding = (
+            ("rb", None) if file_type == cls.FileType.DICTLIST else ("r", "UTF-8-sig")
+        )
+
+        with open(file, mode, encoding=encoding) as f:
+            elements = {
+                cls.FileType.DICTLIST: cls._iter_pickle,
+                cls.FileType.CSV: cls._iter_csv,
+                cls.FileType.JSON: cls._iter_json,
+                cls.FileType.JSONL: cls._iter_jsonl,
+            }[file_type](f)
+
+            yield from cls._iter_chunks(elements, chunk_size)
+
+    @staticmethod
+    def _get_keys(data: Iterable[Dict[str, Any]]) -> List[str]:
+        return list(OrderedDict.fromkeys(key for element in data for key in element))
+
+    @staticmethod
+    def _iter_chunks(
+        elements: Iterator[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        if chunk_size is None:
+            yield from elements
+
+        else:
+            while chunk := list(islice(elements, chunk_size)):
+                yield chunk
+
+    @staticmethod
+    def _iter_pickle(f) -> Iterator[Dict[str, Any]]:
+        while True:
+            try:
+                data = load_pickle(f)
+
+            except EOFError:
+                return
+
+            yield from data
+
+    @staticmethod
+    def _iter_csv(f) -> Iterator[Dict[str, Any]]:
+        rows = read_csv(f)
+
+        if (keys := next(rows, None)) is not None:
+            for l in rows:
+                yield {k: l[i] for i, k in enumerate(keys) if l[i]}
+
+    @staticmethod
+    def _iter_json(f, size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+        decoder = JSONDecoder()
+        space = compile(r"\s*")
+
+        # expects "[" first, then an element, then "," or "]" until the end
+        buffer, index, eof, expect = "", 0, False, "["
+        while True:
+            index = space.match(buffer, index).end()
+
+            if index == len(buffer):
+                if eof:
+                    if expect == "end":
+                        return
+
+                    raise JSONDecodeError("Unterminated array", buffer, index)
+
+                eof = not (chunk := f.read(size))
+                buffer, index = buffer[index:] + chunk, 0
+                continue
+
+            char = buffer[index]
+            if expect == "end":
+                raise JSONDecodeError("Extra data", buffer, index)
+
+            elif expect == "[":
+                if char != "[":
+                    raise JSONDecodeError("Expecting '['", buffer, index)
+
+                index, expect = index + 1, "first"
+
+            elif char == "]" and expect != "element":
+                index, expect = index + 1, "end"
+
+            elif expect == "separator":
+                if char != ",":
+                    raise JSONDecodeError("Expecting ',' delimiter", buffer, index)
+
+                index, expect = index + 1, "element"
+
+            else:
+                try:
+                    element, end = decoder.raw_decode(buffer, index)
+
+                except ValueError:  # incomplete element in buffer
+                    if eof:
+                        raise
+
+                    end = len(buffer)
+
+                if end == len(buffer) and not eof:  # may continue in the next chunk
+                    eof = not (chunk := f.read(size))
+                    buffer, index = buffer[index:] + chunk, 0
+                    continue
+
+                index, expect = end, "separator"
+                yield element
+
+    @staticmethod
+    def _iter_jsonl(f) -> Iterator[Dict[str, Any]]:
+        for line in f:
+            if line.strip():
+                yield loads_json(line)
 
     def read(
         self,
         file: str,
         file_type: Optional[Union[FileType, str]] = None,
     ) -> None:
-        if file_type is None:
-            file_type = self.FileType(OS.get_extension(file))
-
-        elif isinstance(file_type, str):
-            file_type = self.FileType(file_type)
+        file_type = self._get_file_type(file, file_type)
 
         if not OS.is_exist(file):
             return
 
         if file_type == self.FileType.DICTLIST:
             with open(file, "rb") as f:
-                self.extend(load_pickle(f))
+                self.extend(list(self._iter_pickle(f)))
 
         elif file_type == self.FileType.CSV:
             with open(file, "r", encoding="UTF-8-sig") as f:
-                if len((rows := [l for l in read_csv(f)])) >= 2:
-                    keys = [key for key in rows[0]]
-                    data = [
-                        {k: l[i] for i, k in enumerate(keys) if l[i]} for l in rows[1:]
-                    ]
-                    self.extend(data)
+                self.extend(list(self._iter_csv(f)))
 
         elif file_type == self.FileType.JSON:
             with open(file, "r", encoding="UTF-8-sig") as f:
                 self.extend(load_json(f))
 
+        elif file_type == self.FileType.JSONL:
+            with open(file, "r", encoding="UTF-8-sig") as f:
+                self.extend(list(self._iter_jsonl(f)))
+
+        elif file_type == self.FileType.COLUMNS:
+            columns = _Columns.open(file)
+
+            if isinstance(self._data, _Columns) and not len(self._data):
+                self._data = columns
+                self._add_indexes(self._data)
+
+            else:
+                self.extend(list(columns))
+
     def write(
         self,
         file: str,
         file_type: Optional[Union[FileType, str]] = None,
     ) -> None:
-        if file_type is None:
-            file_type = self.FileType(OS.get_extension(file))
-
-        elif isinstance(file_type, str):
-            file_type = self.FileType(file_type)
+        file_type = self._get_file_type(file, file_type)
 
         if not len(self._data):
             return
 
         OS.make_dir(OS.get_dir(file))
 
+        if file_type == self.FileType.COLUMNS:
+            columns = self._data
+            if not isinstance(columns, _Columns):
+                columns = _Columns(self._data)
+
+            # mapped columns may refer to the file itself
+            with open(temp := f"{file}.tmp", "wb") as f:
+                columns.dump(f)
+
+            OS.move(temp, file)
+            return
+
+        data = self._get_list()
+
         if file_type == self.FileType.DICTLIST:
             with open(file, "wb") as f:
-                dump_pickle(self._data, f)
+                for i in range(0, max(len(data), 1), self._FRAME):
+                    dump_pickle(data[i : i + self._FRAME], f)
 
         elif file_type == self.FileType.CSV:
             with open(file, "w", encoding="UTF-8-sig", newline="\n") as f:
-                keys = reduce(
-                    lambda keys, element: list(
-                        OrderedDict.fromkeys(keys + list(element.keys()))
-                    ),
-                    self._data,
-                    [],
-                )
-                csv_writer = DictWriter(f, keys)
+                csv_writer = DictWriter(f, self._get_keys(data))
                 csv_writer.writeheader()
-                csv_writer.writerows(self._data)
+                csv_writer.writerows(data)
 
         elif file_type == self.FileType.JSON:
             with open(file, "w", encoding="UTF-8-sig") as f:
-                dump_json(self._data, f, ensure_ascii=False, indent="\t")
+                dump_json(data, f, ensure_ascii=False, indent="\t")
+
+        elif file_type == self.FileType.JSONL:
+            with open(file, "w", encoding="UTF-8-sig") as f:
+                f.writelines(f"{dumps_json(e, ensure_ascii=False)}\n" for e in data)
+
+    def flush(
+        self,
+        file: str,
+        file_type: Optional[Union[FileType, str]] = None,
+        compaction: int = 100,
+    ) -> None:
+        file_type = self._get_file_type(file, file_type)
+
+        if file_type not in (
+            self.FileType.DICTLIST,
+            self.FileType.CSV,
+            self.FileType.JSONL,
+        ):
+            err = f"Invalid file type for flush: {file_type}"
+            self._trace.critical(err)
+            raise TypeError(err)
+
+        if (
+            (journal := self._journal) is None
+            or journal["file"] != file
+            or journal["file_type"] != file_type
+            or journal["frames"] >= compaction
+            or not OS.is_exist(file)
+        ):
+            self.write(file, file_type)
+            self._journal = {
+                "file": file,
+                "file_type": file_type,
+                "count": len(self._data),
+                "frames": 0,
+                "keys": (
+                    self._get_keys(self._data)
+                    if file_type == self.FileType.CSV
+                    else None
+                ),
+            }
+            return
+
+        if not (data := self._data[journal["count"] :]):
+            return
+
+        if file_type == self.FileType.CSV and any(
+            key not in journal["keys"] for key in self._get_keys(data)
+        ):
+            self._journal = None
+            self.flush(file, file_type, compaction)
+            return
+
+        if file_type == self.FileType.DICTLIST:
+            with open(file, "ab") as f:
+                for i in range(0, len(data), self._FRAME):
+                    dump_pickle(data[i : i + self._FRAME], f)
+
+        elif file_type == self.FileType.CSV:
+            with open(file, "a", encoding="UTF-8-sig", newline="\n") as f:
+                DictWriter(f, journal["keys"]).writerows(data)
+
+        elif file_type == self.FileType.JSONL:
+            with open(file, "a", encoding="UTF-8-sig") as f:
+                f.writelines(f"{dumps_json(e, ensure_ascii=False)}\n" for e in data)
+
+        journal["count"] = len(self._data)
+        journal["frames"] += 1
+
+
+class _Columns:
+    _TYPES = {int: "q", float: "d"}
+    _MAGIC = b"DictList"
+
+    def __init__(self, data: Iterable[Dict[str, Any]] = ()) -> None:
+        self._columns: Dict[str, Union[array, List[Any]]] = {}
+        self._len = 0
+
+        self.extend(data)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._len):
+            yield self._get_row(index)
+
+    def __contains__(self, element: Dict[str, Any]) -> bool:
+        return any(row == element for row in self)
+
+    def __getitem__(
+        self,
+        arg: Union[slice, int],
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        if isinstance(arg, slice):
+            return [self._get_row(index) for index in range(self._len)[arg]]
+
+        return self._get_row(range(self._len)[arg])
+
+    def _get_row(self, index: int) -> Dict[str, Any]:
+        return {
+            key: value
+            for key, column in self._columns.items()
+            if (value := column[index]) is not DictList.MISSING
+        }
+
+    def _thaw(self) -> None:
+        for key, column in self._columns.items():
+            if not isinstance(column, (array, list)):
+                self._columns[key] = self._get_thawed(column)
+
+    @staticmethod
+    def _get_thawed(column: Any) -> Union[array, List[Any]]:
+        if isinstance(column, memoryview):
+            thawed = array(column.format)
+            thawed.frombytes(column.cast("B"))
+            return thawed
+
+        return list(column)
+
+    def _get_writable(self, key: str, value: Any) -> Union[array, List[Any]]:
+        if (column := self._columns.get(key)) is None:
+            column = self._columns[key] = (
+                array(self._TYPES[type(value)])
+                if not self._len and type(value) in self._TYPES
+                else [DictList.MISSING] * self._len
+            )
+
+        if isinstance(column, array) and not self._is_fit(column, value):
+            column = self._columns[key] = column.tolist()
+
+        return column
+
+    @staticmethod
+    def _is_fit(column: array, value: Any) -> bool:
+        if type(value) is int:
+            return column.typecode == "q" and -(2**63) <= value < 2**63
+
+        return type(value) is float and column.typecode == "d"
+
+    def get_keys(self) -> List[str]:
+        return list(self._columns.keys())
+
+    def get_column(self, key: str) -> Union[array, memoryview, List[Any]]:
+        if isinstance(column := self._columns[key], _PickledColumn):
+            column = self._columns[key] = column.load()
+
+        return column
+
+    def get_values(self, key: str) -> List[Any]:
+        if (column := self._columns.get(key)) is None:
+            return []
+
+        if isinstance(column, (array, memoryview)):
+            return column.tolist()
+
+        return [value for value in column if value is not DictList.MISSING]
+
+    def index(self, element: Dict[str, Any]) -> int:
+        for index, row in enumerate(self):
+            if row == element:
+                return index
+
+        raise ValueError(f"{element} is not in columns")
+
+    def append(self, element: Dict[str, Any]) -> None:
+        self._thaw()
+        LOOP(self._get_writable(key, value) for key, value in element.items())
+
+        for key, column in self._columns.items():
+            if (value := element.get(key, DictList.MISSING)) is DictList.MISSING:
+                column = self._get_writable(key, value)
+
+            column.append(value)
+
+        self._len += 1
+
+    def extend(self, data: Iterable[Dict[str, Any]]) -> None:
+        LOOP(self.append(element) for element in data)
+
+    def insert(self, index: int, element: Dict[str, Any]) -> None:
+        index = min(max(index + self._len if index < 0 else index, 0), self._len)
+
+        self._thaw()
+        LOOP(self._get_writable(key, value) for key, value in element.items())
+
+        for key, column in self._columns.items():
+            if (value := element.get(key, DictList.MISSING)) is DictList.MISSING:
+                column = self._get_writable(key, value)
+
+            column.insert(index, value)
+
+        self._len += 1
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        element = self._get_row(index := range(self._len)[index])
+
+        self._thaw()
+        for column in self._columns.values():
+            del column[index]
+
+        self._len -= 1
+        return element
+
+    def remove(self, element: Dict[str, Any]) -> None:
+        self.pop(self.index(element))
+
+    def clear(self) -> None:
+        self._columns.clear()
+        self._len = 0
+
+    def evict(self, count: int) -> None:
+        self._thaw()
+        for column in self._columns.values():
+            del column[:count]
+
+        self._len -= count
+
+    def sort_by(self, key: Callable[[int], Any]) -> None:
+        if self._len:
+            order = sorted(range(self._len), key=key)
+            if any(i != index for i, index in enumerate(order)):
+                self.reorder(order)
+
+    def reorder(self, order: List[int]) -> None:
+        self._thaw()
+
+        for key, column in self._columns.items():
+            self._columns[key] = (
+                array(column.typecode, (column[i] for i in order))
+                if isinstance(column, array)
+                else [column[i] for i in order]
+            )
+
+    @classmethod
+    def open(cls, file: str) -> "_Columns":
+        with open(file, "rb") as f:
+            mapped = memoryview(mmap(f.fileno(), 0, access=ACCESS_READ))
+
+        if mapped[: len(cls._MAGIC)] != cls._MAGIC:
+            err = f"Invalid file: {file}"
+            raise ValueError(err)
+
+        size = unpack_from("<Q", mapped, len(cls._MAGIC))[0]
+        start = len(cls._MAGIC) + 8 + size
+        header = loads_json(bytes(mapped[start - size : start]))
+        start += -start % 8
+
+        columns = cls()
+        for key, type_, offset, size in header["columns"]:
+            blob = mapped[start + offset : start + offset + size]
+
+            if type_ == "O":
+                columns._columns[key] = _PickledColumn(blob)
+
+            elif header["byteorder"] != byteorder:
+                values = array("q" if type_ == "M" else type_)
+                values.frombytes(blob)
+                values.byteswap()
+
+                columns._columns[key] = (
+                    _DatetimeColumn(values) if type_ == "M" else values
+                )
+
+            else:
+                columns._columns[key] = (
+                    _DatetimeColumn(blob.cast("q"))
+                    if type_ == "M"
+                    else blob.cast(type_)
+                )
+
+        columns._len = header["len"]
+        return columns
+
+    def dump(self, f) -> None:
+        blobs = [(key, *self._encode(column)) for key, column in self._columns.items()]
+
+        columns, offset = [], 0
+        for key, type_, blob in blobs:
+            columns.append([key, type_, offset, len(blob)])
+            offset += len(blob) + (-len(blob) % 8)
+
+        header = dumps_json(
+            {"len": self._len, "byteorder": byteorder, "columns": columns},
+            ensure_ascii=False,
+        ).encode()
+        f.write(self._MAGIC + pack("<Q", len(header)) + header)
+        f.write(bytes(-(len(self._MAGIC) + 8 + len(header)) % 8))
+
+        for _, _, blob in blobs:
+            f.write(blob)
+            f.write(bytes(-len(blob) % 8))
+
+    @staticmethod
+    def _encode(column: Any) -> tuple:
+        if isinstance(column, array):
+            return column.typecode, memoryview(column).cast("B")
+
+        if isinstance(column, memoryview):
+            return column.format, column.cast("B")
+
+        if isinstance(column, _DatetimeColumn):
+            return "M", column.values.cast("B")
+
+        if isinstance(column, _PickledColumn):
+            column = column.load()
+
+        if all(type(v) is datetime and v.tzinfo is None for v in column):
+            values = array("q", ((v - _EPOCH) // _MICROSECOND for v in column))
+            return "M", memoryview(values).cast("B")
+
+        return "O", dumps_pickle(column)
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class _DatetimeColumn:
+    def __init__(self, values: Union[array, memoryview]) -> None:
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[datetime]:
+        for value in self._values:
+            yield _EPOCH + value * _MICROSECOND
+
+    def __getitem__(self, index: int) -> datetime:
+        return _EPOCH + self._values[index] * _MICROSECOND
+
+    @property
+    def values(self) -> Union[array, memoryview]:
+        return self._values
+
+
+class _PickledColumn:
+    def __init__(self, blob: memoryview) -> None:
+        self._blob = blob
+        self._values = None
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.load())
+
+    def __getitem__(self, index: int) -> Any:
+        return self.load()[index]
+
+    def load(self) -> List[Any]:
+        if self._values is None:
+            self._values = loads_pickle(self._blob)
+
+        return self._values
+
+
+class _Count:
+    def __init__(self) -> None:
+        self._count = 0
+
+    def add(self, value: Any) -> None:
+        self._count += 1
+
+    def remove(self, value: Any) -> None:
+        self._count -= 1
+
+    def get(self) -> int:
+        return self._count
+
+
+class _Sum:
+    def __init__(self) -> None:
+        self._sum = 0
+
+    def add(self, value: Any) -> None:
+        self._sum += value
+
+    def remove(self, value: Any) -> None:
+        self._sum -= value
+
+    def get(self) -> Union[int, float]:
+        return self._sum
+
+
+class _Max:
+    def __init__(self) -> None:
+        self._max = None
+
+    def add(self, value: Any) -> None:
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def get(self) -> Any:
+        return self._max
+
+
+class _Min:
+    def __init__(self) -> None:
+        self._min = None
+
+    def add(self, value: Any) -> None:
+        if self._min is None or value < self._min:
+            self._min = value
+
+    def get(self) -> Any:
+        return self._min
+
+
+class _First:
+    def __init__(self) -> None:
+        self._value = None
+        self._empty = True
+
+    def add(self, value: Any) -> None:
+        if self._empty:
+            self._value = value
+            self._empty = False
+
+    def get(self) -> Any:
+        return self._value
+
+
+class _Last:
+    def __init__(self) -> None:
+        self._value = None
+
+    def add(self, value: Any) -> None:
+        self._value = value
+
+    def get(self) -> Any:
+        return self._value
+
+
+class _Range:
+    def __init__(self) -> None:
+        self._max = _Max()
+        self._min = _Min()
+
+    def add(self, value: Any) -> None:
+        self._max.add(value)
+        self._min.add(value)
+
+    def get(self) -> float:
+        if (max_ := self._max.get()) is None:
+            return float("NaN")
+
+        return max_ - self._min.get()
+
+
+class _Variance:  # Welford's online algorithm
+    def __init__(self) -> None:
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: Any) -> None:
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def remove(self, value: Any) -> None:
+        if (count := self._count - 1) == 0:
+            self.__init__()
+            return
+
+        self._count = count
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 -= delta * (value - self._mean)
+
+    def get(self) -> float:
+        return Math.ratio(self._m2, self._count)
+
+    def get_average(self) -> float:
+        return self._mean if self._count else float("NaN")
+
+
+class _Average(_Variance):
+    def get(self) -> float:
+        return self.get_average()
+
+
+class _StandardDeviation(_Variance):
+    def get(self) -> float:
+        variance = super().get()
+        return variance if Math.is_NaN(variance) else sqrt(variance)
+
+
+class _Values:
+    def __init__(self, function: Callable[[List[Any]], Any]) -> None:
+        self._function = function
+        self._values = []
+
+    def add(self, value: Any) -> None:
+        self._values.append(value)
+
+    def get(self) -> Any:
+        return self._function(self._values)
+
+
+class _Extreme:  # monotonic deque over a first-in first-out window
+    def __init__(self, better: Callable[[Any, Any], bool]) -> None:
+        self._better = better
+        self._values = deque()
+
+    def add(self, value: Any) -> None:
+        while self._values and self._better(value, self._values[-1]):
+            self._values.pop()
+
+        self._values.append(value)
+
+    def remove(self, value: Any) -> None:
+        if self._values and self._values[0] == value:
+            self._values.popleft()
+
+    def get(self) -> Any:
+        return self._values[0] if self._values else None
+
+
+class _SlidingRange:
+    def __init__(self) -> None:
+        self._max = _Extreme(gt)
+        self._min = _Extreme(lt)
+
+    def add(self, value: Any) -> None:
+        self._max.add(value)
+        self._min.add(value)
+
+    def remove(self, value: Any) -> None:
+        self._max.remove(value)
+        self._min.remove(value)
+
+    def get(self) -> float:
+        if (max_ := self._max.get()) is None:
+            return float("NaN")
+
+        return max_ - self._min.get()
+
+
+class _Edge:  # first or last value read from the window itself
+    def __init__(self, values: deque, index: int) -> None:
+        self._values = values
+        self._index = index
+
+    def add(self, value: Any) -> None:
+        pass
+
+    def remove(self, value: Any) -> None:
+        pass
+
+    def get(self) -> Any:
+        return self._values[self._index] if self._values else None
+
+
+class _Sliding:  # accumulator over a first-in first-out window
+    def __init__(self, accumulator: Callable[[], Any]) -> None:
+        self._accumulator = accumulator
+        self._values = deque()
+        self._stale = False
+
+        sliding = _SLIDING_ACCUMULATORS.get(accumulator)
+        self._state = sliding(self._values) if sliding else accumulator()
+
+    def add(self, value: Any) -> None:
+        self._values.append(value)
+
+        if not self._stale:
+            self._state.add(value)
+
+    def remove(self) -> None:
+        value = self._values.popleft()
+
+        if hasattr(self._state, "remove"):
+            self._state.remove(value)
+
+        else:  # rebuilt from the window on the next get
+            self._stale = True
+
+    def get(self) -> Any:
+        if self._stale:
+            self._state = self._accumulator()
+            LOOP(self._state.add(value) for value in self._values)
+            self._stale = False
+
+        return self._state.get()
+
+
+_ACCUMULATORS = {
+    "count": _Count,
+    "sum": _Sum,
+    "max": _Max,
+    "min": _Min,
+    "first": _First,
+    "last": _Last,
+    "range": _Range,
+    "average": _Average,
+    "variance": _Variance,
+    "standard_deviation": _StandardDeviation,
+}
+_SLIDING_ACCUMULATORS = {
+    _Max: lambda values: _Extreme(gt),
+    _Min: lambda values: _Extreme(lt),
+    _First: lambda values: _Edge(values, 0),
+    _Last: lambda values: _Edge(values, -1),
+    _Range: lambda values: _SlidingRange(),
+}
+
+_MATH_ACCUMULATORS = {
+    Math.sum: _Sum,
+    Math.max: _Max,
+    Math.min: _Min,
+    Math.range: _Range,
+    Math.average: _Average,
+    Math.variance: _Variance,
+    Math.standard_deviation: _StandardDeviation,
+}
+
+
+def _get_targets(
+    aggregations: Dict[str, Union[str, Callable, Tuple[str, Any]]],
+) -> List[Tuple[str, str, Union[str, Callable]]]:
+    return [
+        (output, *(spec if isinstance(spec, tuple) else (output, spec)))
+        for output, spec in aggregations.items()
+    ]
+
+
+def _get_accumulator(function: Union[str, Callable]) -> Callable[[], Any]:
+    if isinstance(function, str):
+        if function not in _ACCUMULATORS:
+            err = f"Invalid aggregation: {function}"
+            raise ValueError(err)
+
+        return _ACCUMULATORS[function]
+
+    if (accumulator := _MATH_ACCUMULATORS.get(function)) is not None:
+        return accumulator
+
+    return lambda: _Values(function)
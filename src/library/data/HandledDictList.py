@@ -1,34 +1,131 @@
-from typing import Dict, List, Optional, Union, Any, Callable
+from typing import Dict, Iterable, List, Optional, Union, Any, Callable, Tuple
+from pickle import load as load_pickle, dump as dump_pickle, dumps as dumps_pickle
 
-from ..lib.macro import KWARGS, KWARGS_STR
+from ..lib.macro import KWARGS, KWARGS_STR, LOOP
+from ..lib.OS import OS
+from ..lib.Process import Process
+from ..lib.Profile import Profile
 from .DictList import DictList
 
 
 class HandledDictList(DictList):
+    class Batch:
+        def __init__(
+            self,
+            handle: Callable[[List[Dict], List[Dict]], Optional[List[Optional[Dict]]]],
+        ) -> None:
+            self._handle = handle
+
+        @property
+        def handle(
+            self,
+        ) -> Callable[[List[Dict], List[Dict]], Optional[List[Optional[Dict]]]]:
+            return self._handle
+
+        def __call__(
+            self,
+            data: List[Dict],
+            pipes: List[Dict],
+        ) -> Optional[List[Optional[Dict]]]:
+            return self._handle(data, pipes)
+
     def __init__(
         self,
-        handles: List[Callable[[Dict, Dict], Optional[Dict]]],
+        handles: List[Union[Callable[[Dict, Dict], Optional[Dict]], Batch]],
         default: Optional[Union[str, List[Dict[str, Any]]]] = None,
         file_type: Optional[Union[DictList.FileType, str]] = None,
         name: Optional[str] = None,
+        indexes: Optional[List[str]] = None,
+        profile: bool = False,
+        partition: Optional[str] = None,
+        process: Optional[Process] = None,
     ):
         self._handles = handles
         self._handled = 0
+        self._partition = partition
+        self._process = process
+
+        self._profiles: Optional[List[Profile]] = None
+        if profile:
+            self._profiles = [
+                Profile(h.handle if isinstance(h, self.Batch) else h) for h in handles
+            ]
+            handles = [
+                self.Batch(p) if isinstance(h, self.Batch) else p
+                for h, p in zip(handles, self._profiles)
+            ]
+
+        # consecutive element handles run together, batch handles run alone
+        self._stages: List[Union[List[Callable], HandledDictList.Batch]] = []
+        for handle in handles:
+            if isinstance(handle, self.Batch):
+                self._stages.append(handle)
+
+            elif self._stages and isinstance(self._stages[-1], list):
+                self._stages[-1].append(handle)
+
+            else:
+                self._stages.append([handle])
 
         super().__init__(
-            **KWARGS(default=default, file_type=file_type, name=name),
+            **KWARGS(default=default, file_type=file_type, name=name, indexes=indexes),
         )
+
+        if (partition is None) != (process is None) or (process and profile):
+            err = "Partitioned handling requires partition and process without profile"
+            self._trace.critical(err)
+            raise ValueError(err)
+
+        if process is not None:
+            try:
+                dumps_pickle(self._stages)
+
+            except Exception as e:  # e.g. lambdas, sent to the processes by pickle
+                err = f"Partitioned handling requires picklable handles: {e!r}"
+                self._trace.critical(err)
+                raise ValueError(err) from e
+
         self._handle()
 
     def _handle(self) -> None:
-        for element in self._data[self._handled :]:
-            pipe = {}
-            for handle in self._handles:
-                if result := handle(element, pipe):
-                    pipe.update(result)
+        if not (data := self._data[self._handled :]):
+            return
+
+        if self._process is None:
+            _handle(self._stages, data)
+
+        else:
+            partitions: Dict[Any, List[int]] = {}
+            for index, element in enumerate(data, self._handled):
+                partitions.setdefault(element.get(self._partition), []).append(index)
+
+            bundles = [
+                Process.Bundle(self._stages, indexes, [self._data[i] for i in indexes])
+                for indexes in partitions.values()
+            ]
+            for indexes, elements in self._process.execute(
+                _handle_partition,
+                bundles,
+                unit=max(len(bundles) // (len(self._process) * 4), 1),
+                silent=True,
+            ):
+                for index, element in zip(indexes, elements):
+                    self._data[index] = element
+
+            data = self._data[self._handled :]
 
+        super()._add_indexes(data)
         self._handled = len(self._data)
 
+    def _add_indexes(
+        self,
+        data: Iterable[Dict[str, Any]],
+        keys: Optional[List[str]] = None,
+    ) -> None:
+        # elements are indexed once handled, as handles may still set indexed fields
+        if data is self._data:
+            super()._add_indexes(self._data[: self._handled], **KWARGS(keys=keys))
+
     def __str__(self) -> str:
         attrs = KWARGS_STR(
             handles=len(self._handles),
@@ -37,6 +134,16 @@ class HandledDictList(DictList):
         )
         return f"{self.__class__.__name__}({attrs})"
 
+    def stats(self) -> List[Dict[str, Any]]:
+        return [p.get() for p in self._profiles] if self._profiles else []
+
+    def print_stats(self) -> None:
+        info = self._trace.info
+
+        info(f"{self}")
+
+        LOOP(info(f"    {KWARGS_STR(**stats)}") for stats in self.stats())
+
     def append(self, element: Dict[str, Any]) -> None:
         super().append(element)
         self._handle()
@@ -65,6 +172,15 @@ class HandledDictList(DictList):
         self._trace.critical(err)
         raise TypeError(err)
 
+    def evict(self, count: int) -> None:
+        if count > self._handled:
+            err = "HandledDictList does not support evicting unhandled elements"
+            self._trace.critical(err)
+            raise TypeError(err)
+
+        super().evict(count)
+        self._handled -= max(count, 0)
+
     def read(
         self,
         file: str,
@@ -72,3 +188,53 @@ class HandledDictList(DictList):
     ) -> None:
         super().read(file, **KWARGS(file_type=file_type))
         self._handle()
+
+    def checkpoint(self, path: str) -> None:
+        OS.make_dir(OS.get_dir(path))
+
+        with open(temp := f"{path}.tmp", "wb") as f:
+            dump_pickle({"handled": self._handled, "data": self._get_list()}, f)
+
+        OS.move(temp, path)
+
+    def restore(self, path: str) -> None:
+        if not OS.is_exist(path):
+            return
+
+        with open(path, "rb") as f:
+            checkpoint = load_pickle(f)
+
+        self._data = checkpoint["data"]
+        self._handled = checkpoint["handled"]
+        self._journal = None
+        self._build_indexes()
+
+        self._handle()
+
+
+def _handle(
+    stages: List[Union[List[Callable], HandledDictList.Batch]],
+    data: List[Dict[str, Any]],
+) -> None:
+    pipes = [{} for _ in data]
+    for stage in stages:
+        if isinstance(stage, HandledDictList.Batch):
+            for pipe, result in zip(pipes, stage(data, pipes) or ()):
+                if result:
+                    pipe.update(result)
+
+            continue
+
+        for element, pipe in zip(data, pipes):
+            for handle in stage:
+                if result := handle(element, pipe):
+                    pipe.update(result)
+
+
+def _handle_partition(
+    stages: List[Union[List[Callable], HandledDictList.Batch]],
+    indexes: List[int],
+    data: List[Dict[str, Any]],
+) -> Tuple[List[int], List[Dict[str, Any]]]:
+    _handle(stages, data)
+    return indexes, data
@@ -1,8 +1,18 @@
-from typing import Callable, Dict, Optional, List
+from typing import Any, Callable, Dict, Iterator, Optional, List, Tuple, Union
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from heapq import merge
+from operator import itemgetter
+from time import perf_counter
+from pickle import load as load_pickle, dump as dump_pickle
 
 from ..lib.macro import ATTR, KWARGS_STR, LOOP
 from ..lib.Trace import Trace
-from .DictList import DictList
+from ..lib.OS import OS
+from ..lib.Datetime import Datetime
+from ..lib.Profile import Profile
+from .DictList import DictList, _get_accumulator, _get_targets
+from .OrderedDictList import _Keys
 
 
 class LinkedDictList:
@@ -11,9 +21,13 @@ class LinkedDictList:
             self,
             data: DictList,
             handles: List[Callable[[Dict, Dict], Optional[Dict]]],
+            retention: Optional[int] = None,
+            duration: Optional[Any] = None,
         ) -> None:
             self._data = data
             self._handles = handles
+            self._retention = retention
+            self._duration = duration
 
             self._handled = 0
             self._pipe = {}
@@ -41,6 +55,14 @@ class LinkedDictList:
         def count(self, count: int = 1):
             self._handled += count
 
+        @property
+        def retention(self):
+            return self._retention
+
+        @property
+        def duration(self):
+            return self._duration
+
         @property
         def pipe(self):
             return self._pipe
@@ -49,12 +71,105 @@ class LinkedDictList:
         def pipe(self, pipe):
             self._pipe = pipe
 
+    class Resample(Node):
+        _OHLCV = {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum",
+        }
+
+        def __init__(
+            self,
+            data: DictList,
+            handles: List[Callable[[Dict, Dict], Optional[Dict]]],
+            source: "LinkedDictList.Node",
+            period: Union[Datetime.Period, str],
+            aggregations: Optional[Dict[str, Union[str, Callable]]] = None,
+            retention: Optional[int] = None,
+            duration: Optional[Any] = None,
+            offset: timedelta = timedelta(),
+        ) -> None:
+            super().__init__(data, handles, retention=retention, duration=duration)
+
+            self._source = source
+            self._period = Datetime.Period(period)
+            self._offset = offset  # e.g. 9 hours for day candles starting 09:00 KST
+
+            if self._period == Datetime.Period.WEEK:
+                err = f"Resample does not support period: {self._period.value}"
+                ATTR(DictList, "trace", lambda: Trace("core")).critical(err)
+                raise ValueError(err)
+            self._targets = _get_targets(aggregations if aggregations else self._OHLCV)
+
+            self._last = None
+            self._bucket = None
+            self._next = None
+            self._states = []
+
+        @property
+        def source(self):
+            return self._source
+
+        def resample(self, key: str) -> None:
+            data = self._source.data
+
+            if self._next is None and len(self._data):
+                # resume after the last emitted candle, e.g. after a restore
+                _, self._next = self._get_bucket(self._data[-1][key])
+
+            start = len(data)
+            while start and self._is_pending(data[start - 1][key]):
+                start -= 1
+
+            for e in range(start, len(data)):
+                element = data[e]
+
+                if self._next is None or not element[key] < self._next:
+                    if self._bucket is not None:
+                        self._data.append(self._get_candle(key))
+
+                    self._bucket, self._next = self._get_bucket(element[key])
+                    self._states = [
+                        _get_accumulator(function)() for _, _, function in self._targets
+                    ]
+
+                for (_, field, _), state in zip(self._targets, self._states):
+                    if field in element:
+                        state.add(element[field])
+
+                self._last = element[key]
+
+        def _get_bucket(self, value: datetime) -> Tuple[datetime, datetime]:
+            bucket = Datetime(value - self._offset).get_slice(self._period)
+            return (
+                bucket.to_datetime() + self._offset,
+                bucket.get_after(self._period).to_datetime() + self._offset,
+            )
+
+        def _is_pending(self, value: Any) -> bool:
+            if self._last is not None:
+                return value > self._last
+
+            return self._next is None or not value < self._next
+
+        def _get_candle(self, key: str) -> Dict[str, Any]:
+            return {
+                key: self._bucket,
+                **{
+                    output: state.get()
+                    for (output, _, _), state in zip(self._targets, self._states)
+                },
+            }
+
     def __init__(
         self,
         key: str,
         nodes: List[Node],
         handles: Optional[List[Callable[[Dict, Dict], Optional[Dict]]]] = None,
         name: Optional[str] = None,
+        profile: bool = False,
     ):
         self._key = key
         self._nodes = nodes
@@ -62,6 +177,26 @@ class LinkedDictList:
         self._name = name
         self._trace = ATTR(DictList, "trace", lambda: Trace("core"))
 
+        # columnar rows are copies, so writes from handles would be lost
+        if any(node.data.columnar for node in nodes):
+            err = "LinkedDictList does not support columnar node data"
+            self._trace.critical(err)
+            raise TypeError(err)
+
+        self._profiles: Optional[List[Profile]] = None
+        self._node_handles = [node.handles for node in nodes]
+        self._list_handles = handles if handles else []
+
+        if profile:
+            self._profiles = [
+                Profile(None, f"node[{n}]") for n in range(len(self._nodes))
+            ]
+            self._node_handles = [
+                [Profile(h, f"node[{n}].{Profile.get_name(h)}") for h in hs]
+                for n, hs in enumerate(self._node_handles)
+            ]
+            self._list_handles = [Profile(h) for h in self._list_handles]
+
     def __len__(self) -> int:
         return len(self._nodes)
 
@@ -84,24 +219,137 @@ class LinkedDictList:
 
         LOOP(info(f"    {node}") for node in self._nodes)
 
+    def checkpoint(self, path: str) -> None:
+        OS.make_dir(OS.get_dir(path))
+
+        with open(temp := f"{path}.tmp", "wb") as f:
+            # keys, not positions, so the checkpoint survives eviction
+            dump_pickle(
+                [
+                    {
+                        "last": (
+                            node.data[node.handled - 1][self._key]
+                            if node.handled
+                            else None
+                        ),
+                        "pipe": node.pipe,
+                    }
+                    for node in self._nodes
+                ],
+                f,
+            )
+
+        OS.move(temp, path)
+
+    def restore(self, path: str) -> None:
+        if not OS.is_exist(path):
+            return
+
+        with open(path, "rb") as f:
+            checkpoint = load_pickle(f)
+
+        if len(checkpoint) != len(self._nodes):
+            err = f"Invalid checkpoint for {len(self._nodes)} nodes: {path}"
+            self._trace.critical(err)
+            raise ValueError(err)
+
+        handled = []
+        for node, state in zip(self._nodes, checkpoint):
+            if (last := state["last"]) is None:
+                handled.append(0)
+                continue
+
+            keys = _Keys(node.data, itemgetter(self._key))
+            if not (h := bisect_right(keys, last)) or keys[h - 1] != last:
+                err = f"Invalid checkpoint for {node}, {last} not in data: {path}"
+                self._trace.critical(err)
+                raise ValueError(err)
+
+            handled.append(h)
+
+        for node, state, h in zip(self._nodes, checkpoint, handled):
+            node.count(h - node.handled)
+            node.pipe = state["pipe"]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        if not self._profiles:
+            return []
+
+        return [
+            *(
+                stats
+                for profile, handles in zip(self._profiles, self._node_handles)
+                for stats in [profile.get(), *(h.get() for h in handles)]
+            ),
+            *(h.get() for h in self._list_handles),
+        ]
+
+    def print_stats(self) -> None:
+        info = self._trace.info
+
+        info(f"{self}")
+
+        LOOP(info(f"    {KWARGS_STR(**stats)}") for stats in self.stats())
+
+    def _evict(self, node: Node) -> None:
+        count = 0 if node.retention is None else len(node.data) - node.retention
+
+        if node.duration is not None and len(node.data):
+            limit = node.data[-1][self._key] - node.duration
+            count = max(
+                count,
+                next(
+                    (
+                        e
+                        for e in range(node.handled)
+                        if node.data[e][self._key] >= limit
+                    ),
+                    node.handled,
+                ),
+            )
+
+        if (count := min(count, node.handled)) > 0:
+            node.data.evict(count)
+            node.count(-count)
+
+    def _iter_targets(self, n: int, limit: Any) -> Iterator[Tuple[Any, int, int]]:
+        node = self._nodes[n]
+        for e in range(node.handled, len(node.data)):
+            if (key := node.data[e][self._key]) > limit:
+                return
+
+            yield key, n, e
+
     def handle(self) -> None:
-        for n, e, _ in sorted(
-            [
-                [n, node.handled + e, element[self._key]]
-                for n, node in enumerate(self._nodes)
-                for e, element in enumerate(node.data[node.handled :])
-                if element[self._key] <= self._nodes[-1].data[-1][self._key]
-            ],
-            key=lambda target: (target[2], target[0]),
+        LOOP(
+            node.resample(self._key)
+            for node in self._nodes
+            if isinstance(node, self.Resample)
+        )
+
+        if not self._nodes or not len(self._nodes[-1].data):
+            return
+
+        limit = self._nodes[-1].data[-1][self._key]
+        for _, n, e in merge(
+            *(self._iter_targets(n, limit) for n in range(len(self._nodes)))
         ):
-            for handle in self._nodes[n].handles:
+            if self._profiles:
+                start = perf_counter()
+
+            for handle in self._node_handles[n]:
                 pipe = self._nodes[n - 1].pipe if n else {}
                 if result := handle(self._nodes[n].data[e], pipe):
                     pipe.update(result)
 
             self._nodes[n].count()
 
-            if n == len(self._nodes) - 1 and self._handles:
-                for handle in self._handles:
+            if self._profiles:
+                self._profiles[n].add(perf_counter() - start)
+
+            if n == len(self._nodes) - 1 and self._list_handles:
+                for handle in self._list_handles:
                     if result := handle(self._nodes[n].data[e], self._nodes[n].pipe):
                         self._nodes[n].pipe.update(result)
+
+        LOOP(self._evict(node) for node in self._nodes)
@@ -1,54 +1,418 @@
 from typing import Any, Dict, List, Optional, Union, Iterable, Iterator, overload
+from typing import Callable, Sequence, Tuple
+from enum import Enum
+from functools import total_ordering
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import accumulate, chain, islice
+from operator import itemgetter
 
 from ..lib.macro import KWARGS, KWARGS_STR
-from .DictList import DictList
+from .DictList import DictList, _Sliding, _get_accumulator, _get_targets
 
 
 class OrderedDictList(DictList):
+    class Direction(Enum):
+        BACKWARD = "backward"
+        FORWARD = "forward"
+        NEAREST = "nearest"
+
+    class Order(Enum):
+        ASCENDING = "ascending"
+        DESCENDING = "descending"
+
+    class View:
+        def __init__(self, data: Sequence[Dict[str, Any]], start: int, stop: int):
+            self._data = data
+            self._start = start
+            self._stop = stop
+
+        def __len__(self) -> int:
+            return self._stop - self._start
+
+        def __iter__(self) -> Iterator[Dict[str, Any]]:
+            if isinstance(self._data, _SortedList):
+                yield from self._data.iterate(self._start, self._stop)
+
+            else:
+                for index in range(self._start, self._stop):
+                    yield self._data[index]
+
+        @overload
+        def __getitem__(self, arg: slice, /) -> "OrderedDictList.View": ...
+
+        @overload
+        def __getitem__(self, arg: int, /) -> Dict[str, Any]: ...
+
+        def __getitem__(
+            self,
+            arg: Union[slice, int],
+            /,
+        ) -> Union["OrderedDictList.View", Dict[str, Any]]:
+            indexes = range(self._start, self._stop)[arg]
+
+            if isinstance(arg, slice):
+                if indexes.step != 1:
+                    err = f"{self.__class__.__name__} does not support step: {arg}"
+                    raise ValueError(err)
+
+                return OrderedDictList.View(self._data, indexes.start, indexes.stop)
+
+            return self._data[indexes]
+
+        def __str__(self) -> str:
+            attrs = KWARGS_STR(start=self._start, stop=self._stop)
+            return f"{self.__class__.__name__}({attrs})"
+
+        def get_data(self) -> List[Dict[str, Any]]:
+            return self._data[self._start : self._stop]
+
+        def get_values(self, key: str) -> List[Any]:
+            if isinstance(self._data, _SortedList):
+                return [e[key] for e in self if key in e]
+
+            if key not in self._data.get_keys():
+                return []
+
+            column, missing = self._data.get_column(key), DictList.MISSING
+            return [
+                value
+                for index in range(self._start, self._stop)
+                if (value := column[index]) is not missing
+            ]
+
     def __init__(
         self,
-        key: str,
+        key: Union[str, List[Union[str, Tuple[str, Union[Order, str]]]]],
         default: Optional[Union[str, List[Dict[str, Any]]]] = None,
         file_type: Optional[Union[DictList.FileType, str]] = None,
         name: Optional[str] = None,
+        indexes: Optional[List[str]] = None,
+        columnar: bool = False,
     ):
-        self._key: str = key
-        self._sorted = False
+        self._key: Union[str, Tuple[str, ...]]
+        self._reverses: Optional[Tuple[bool, ...]] = None
+        self._get_value: Callable[[Dict[str, Any]], Any]
+        self._get_key: Callable[[Dict[str, Any]], Any]
 
-        super().__init__(**KWARGS(default=default, file_type=file_type, name=name))
+        if isinstance(key, str):
+            self._key = key
+            self._get_value = self._get_key = itemgetter(key)
 
-    def _sort(self) -> None:
-        if not self._sorted:
-            self._data.sort(key=lambda e: e[self._key])
-            self._sorted = True
+        else:
+            fields = [
+                (
+                    (field, self.Order.ASCENDING)
+                    if isinstance(field, str)
+                    else (field[0], self.Order(field[1]))
+                )
+                for field in key
+            ]
 
-    def __iter__(self) -> Iterator[Dict[str, Any]]:
-        self._sort()
-        for element in self._data:
-            yield element
+            self._key = tuple(field for field, _ in fields)
+            self._reverses = tuple(o == self.Order.DESCENDING for _, o in fields)
+            self._get_value = lambda e: tuple(map(e.__getitem__, self._key))
+            self._get_key = self._get_value
+            if any(self._reverses):
+                self._get_key = lambda e: self._wrap(self._get_value(e))
 
-    @overload
-    def __getitem__(self, arg: slice, /) -> List[Dict[str, Any]]: ...
+        super().__init__(
+            **KWARGS(name=name, indexes=indexes),
+            columnar=columnar,
+        )
 
-    @overload
-    def __getitem__(self, arg: int, /) -> Dict[str, Any]: ...
+        if not columnar:
+            self._data = _SortedList(self._get_key)
 
-    def __getitem__(
+        if isinstance(default, str):
+            self.read(default, **KWARGS(file_type=file_type))
+
+        elif default is not None:
+            self.extend(default)
+
+    @property
+    def composite(self) -> bool:
+        return self._reverses is not None
+
+    def _wrap(self, values: tuple) -> tuple:
+        return tuple(
+            _Reversed(value) if reverse else value
+            for value, reverse in zip(values, self._reverses)
+        )
+
+    def _get_bound(self, value: Any) -> Tuple[Any, Optional[int]]:
+        if not self.composite:
+            return value, None
+
+        values = value if isinstance(value, tuple) else (value,)
+        length = len(values) if len(values) < len(self._key) else None
+        return self._wrap(values), length
+
+    def _bisect(self, value: Any, right: bool) -> int:
+        if not len(self._data):
+            return 0
+
+        value, length = self._get_bound(value)
+        bisect = bisect_right if right else bisect_left
+
+        if not self.columnar:
+            return self._data.bisect(bisect, value, length)
+
+        keys = self._get_sort_keys()
+        if length is not None:  # prefix of the composite key
+            keys = _Keys(keys, itemgetter(slice(None, length)))
+
+        return bisect(keys, value)
+
+    def _get_index_key(self) -> Callable[[int], Any]:
+        if not self.composite:
+            return self._data.get_column(self._key).__getitem__
+
+        columns = [self._data.get_column(field) for field in self._key]
+        return lambda i: self._wrap(tuple(column[i] for column in columns))
+
+    def _get_sort_keys(self) -> Sequence:
+        if not self.columnar:
+            return _Keys(self._data, self._get_key)
+
+        if not len(self._data):
+            return []
+
+        if not self.composite:
+            return self._data.get_column(self._key)
+
+        return _Keys(range(len(self._data)), self._get_index_key())
+
+    def _sort_columns(self) -> None:
+        if len(self._data):
+            self._data.sort_by(self._get_index_key())
+
+    def _merge_columns(self, count: int) -> None:
+        if 0 < count < len(self._data):
+            key = self._get_index_key()
+
+            if key(count) < key(count - 1):
+                self._data.reorder(
+                    list(merge(range(count), range(count, len(self._data)), key=key))
+                )
+
+    def _check_journal(self, data: Iterable[Dict[str, Any]]) -> None:
+        if self._journal is not None and (count := self._journal["count"]):
+            last = self._get_key(self._data[count - 1])
+            if any(self._get_key(e) < last for e in data):
+                self._journal = None
+
+    def lower_bound(self, value: Any) -> int:
+        return self._bisect(value, False)
+
+    def upper_bound(self, value: Any) -> int:
+        return self._bisect(value, True)
+
+    def range(
         self,
-        arg: Union[slice, int],
-        /,
-    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-        self._sort()
-        return super().__getitem__(arg)
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> "OrderedDictList.View":
+        return OrderedDictList.View(
+            self._data,
+            0 if start is None else self.lower_bound(start),
+            len(self._data) if end is None else self.upper_bound(end),
+        )
+
+    def _iter_sort_keys(self) -> Iterator[Any]:
+        if self.columnar:
+            return iter(self._get_sort_keys())
+
+        return map(self._get_key, self._data)
+
+    def _iter_duration_bounds(
+        self,
+        duration: Any,
+        step: int,
+    ) -> Iterator[Tuple[int, int]]:
+        starts, start, first = self._iter_sort_keys(), 0, None
+
+        for stop, key in enumerate(self._iter_sort_keys(), 1):
+            if first is None:
+                first = next(starts)
+
+            while first <= key - duration:
+                first, start = next(starts), start + 1
+
+            if (stop - 1) % step == 0:
+                yield start, stop
+
+    def windows(
+        self,
+        size: Optional[int] = None,
+        step: int = 1,
+        duration: Optional[Any] = None,
+        aggregations: Optional[Dict[str, Union[str, Callable, Tuple[str, Any]]]] = None,
+    ) -> Iterator[
+        Union["OrderedDictList.View", Tuple["OrderedDictList.View", Dict[str, Any]]]
+    ]:
+        if (size is None) == (duration is None):
+            err = "windows requires either size or duration"
+            self._trace.critical(err)
+            raise ValueError(err)
+
+        if (
+            step <= 0
+            or (size is not None and size <= 0)
+            or (duration is not None and not duration > duration * 0)
+        ):
+            err = "windows requires positive size, step and duration"
+            self._trace.critical(err)
+            raise ValueError(err)
+
+        # composite keys are tuples, which have no duration
+        if duration is not None and self.composite:
+            err = "windows by duration requires a single ascending key"
+            self._trace.critical(err)
+            raise ValueError(err)
+
+        if size is not None:
+            bounds = (
+                (start, start + size)
+                for start in range(0, len(self._data) - size + 1, step)
+            )
+
+        else:
+            bounds = self._iter_duration_bounds(duration, step)
+
+        if aggregations is None:
+            return (OrderedDictList.View(self._data, *bound) for bound in bounds)
+
+        return self._iter_aggregated_windows(bounds, aggregations)
+
+    def _iter_aggregated_windows(
+        self,
+        bounds: Iterator[Tuple[int, int]],
+        aggregations: Dict[str, Union[str, Callable, Tuple[str, Any]]],
+    ) -> Iterator[Tuple["OrderedDictList.View", Dict[str, Any]]]:
+        targets = _get_targets(aggregations)
+        states = [_Sliding(_get_accumulator(function)) for _, _, function in targets]
+
+        entering, leaving = iter(self._data), iter(self._data)
+        lower, upper = 0, 0
+
+        for start, stop in bounds:
+            for element in islice(entering, stop - upper):
+                for (_, key, _), state in zip(targets, states):
+                    if key in element:
+                        state.add(element[key])
+
+            for element in islice(leaving, start - lower):
+                for (_, key, _), state in zip(targets, states):
+                    if key in element:
+                        state.remove()
+
+            lower, upper = start, stop
+            yield OrderedDictList.View(self._data, start, stop), {
+                output: state.get() for (output, _, _), state in zip(targets, states)
+            }
+
+    def _get_asof_index(
+        self,
+        keys: Sequence,
+        lower: int,
+        upper: int,
+        value: Any,
+        direction: Direction,
+        tolerance: Optional[Any],
+    ) -> Optional[int]:
+        backward = upper - 1 if upper else None
+        forward = lower if lower < len(keys) else None
+
+        # composite keys only match rows sharing the leading fields
+        if isinstance(value, tuple):
+            prefix = value[:-1]
+            backward, forward = (
+                i if i is not None and keys[i][:-1] == prefix else None
+                for i in (backward, forward)
+            )
+
+        if direction == self.Direction.BACKWARD:
+            index = backward
+
+        elif direction == self.Direction.FORWARD:
+            index = forward
+
+        elif backward is None or forward is None:
+            index = forward if backward is None else backward
+
+        else:
+            nearer = _get_distance(keys[forward], value) < _get_distance(
+                keys[backward], value
+            )
+            index = forward if nearer else backward
+
+        if (
+            index is not None
+            and tolerance is not None
+            and _get_distance(keys[index], value) > tolerance
+        ):
+            return None
+
+        return index
+
+    def get_asof(
+        self,
+        value: Any,
+        direction: Union[Direction, str] = Direction.BACKWARD,
+        tolerance: Optional[Any] = None,
+    ) -> Union[Dict[str, Any], None]:
+        index = self._get_asof_index(
+            self._get_sort_keys(),
+            self.lower_bound(value),
+            self.upper_bound(value),
+            self._get_bound(value)[0],
+            self.Direction(direction),
+            tolerance,
+        )
+
+        return None if index is None else self._data[index]
+
+    def asof_join(
+        self,
+        other: "OrderedDictList",
+        direction: Union[Direction, str] = Direction.BACKWARD,
+        tolerance: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        direction = self.Direction(direction)
+
+        data = other.get_data()
+        keys = [other._get_key(e) for e in data]
+
+        joined, lower, upper = [], 0, 0
+        for element in self._data:
+            value = self._get_key(element)
+
+            while lower < len(keys) and keys[lower] < value:
+                lower += 1
+
+            upper = max(upper, lower)
+            while upper < len(keys) and keys[upper] <= value:
+                upper += 1
+
+            index = self._get_asof_index(
+                keys, lower, upper, value, direction, tolerance
+            )
+            joined.append(element if index is None else {**data[index], **element})
+
+        return joined
+
+    def _select(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if (candidates := super()._select(queries)) is self._data:
+            return candidates
+
+        return sorted(candidates, key=self._get_key)
 
     def __str__(self) -> str:
         attrs = KWARGS_STR(key=self._key, len=len(self._data), name=self._name)
         return f"{self.__class__.__name__}({attrs})"
 
-    def print(self, shorten: Optional[bool] = None) -> None:
-        self._sort()
-        super().print(**KWARGS(shorten=shorten))
-
     def get_element(
         self,
         arg1: Union[Any, str, Dict[str, Any]],
@@ -56,18 +420,8 @@ class OrderedDictList(DictList):
         /,
     ) -> Union[Dict[str, Any], None]:
         if arg2 is None and not isinstance(arg1, dict):  # arg1: Any
-            self._sort()
-
-            l, r = 0, len(self._data) - 1
-            while l <= r:
-                if self._data[(i := (l + r) // 2)][self._key] > arg1:
-                    r = i - 1
-
-                elif self._data[i][self._key] < arg1:
-                    l = i + 1
-
-                else:
-                    return self._data[i]
+            if view := self.range(arg1, arg1):
+                return view[0]
 
         else:
             return super().get_element(arg1, arg2)
@@ -79,8 +433,7 @@ class OrderedDictList(DictList):
         /,
     ) -> List[Dict[str, Any]]:
         if arg2 is None and arg1 is not None and not isinstance(arg1, dict):
-            arg2 = arg1
-            arg1 = self._key
+            return self.range(arg1, arg1).get_data()
 
         return super().get_data(arg1, arg2)
 
@@ -93,8 +446,19 @@ class OrderedDictList(DictList):
         include: Optional[Iterable] = None,
         exclude: Optional[Iterable] = None,
     ) -> List[Dict[str, Any]]:
+        if key is None or key == self._key:
+            data = self.range(**KWARGS(start=start, end=end)).get_data()
+
+            if include is not None:
+                data = [e for e in data if self._get_value(e) in include]
+
+            if exclude is not None:
+                data = [e for e in data if self._get_value(e) not in exclude]
+
+            return data
+
         return super().get_filtered_data(
-            self._key if key is None else key,
+            key,
             **KWARGS(start=start, end=end, include=include, exclude=exclude),
         )
 
@@ -104,27 +468,60 @@ class OrderedDictList(DictList):
         overlap: Optional[bool] = None,
         sort: Optional[bool] = None,
     ) -> List:
-        self._sort()
+        if key is None and self.composite:  # already in the composite order
+            values = [self._get_value(e) for e in self._data]
+            return (
+                values if overlap is not False else list(OrderedDict.fromkeys(values))
+            )
+
         return super().get_values(
             self._key if key is None else key,
             **KWARGS(overlap=overlap, sort=sort),
         )
 
     def append(self, element: Dict[str, Any]) -> None:
-        super().append(element)
-        self._sorted = False
+        self._check_journal((element,))
+
+        if self.columnar:
+            self._data.insert(self.upper_bound(self._get_value(element)), element)
+
+        else:
+            self._data.add(element)
+
+        self._add_indexes((element,))
+
+    def extend(self, data: List[Dict[str, Any]], presorted: bool = False) -> None:
+        data = list(data)  # consumed more than once below
+
+        if presorted:
+            keys = [self._get_key(e) for e in data]
+            if any(b < a for a, b in zip(keys, islice(keys, 1, None))):
+                data.sort(key=self._get_key)
 
-    def extend(self, data: List[Dict[str, Any]]) -> None:
-        super().extend(data)
-        self._sorted = False
+        self._check_journal(data)
+
+        if self.columnar:
+            count = len(self._data)
+            self._data.extend(data)
+
+            if presorted:
+                self._merge_columns(count)
+
+            else:
+                self._sort_columns()
+
+        elif presorted:
+            self._data.merge(data)
+
+        else:
+            self._data.update(data)
+
+        self._add_indexes(data)
 
     def insert(self, element: Dict[str, Any], *, index: int = 0) -> None:
-        err = "OrderedDictList does not support insert operation"
-        self._trace.critical(err)
-        raise TypeError(err)
+        self.append(element)  # position is determined by the key
 
     def pop(self, index: Optional[int] = None) -> Dict[str, Any]:
-        self._sort()
         return super().pop(**KWARGS(index=index))
 
     def read(
@@ -133,12 +530,251 @@ class OrderedDictList(DictList):
         file_type: Optional[Union[DictList.FileType, str]] = None,
     ) -> None:
         super().read(file, **KWARGS(file_type=file_type))
-        self._sorted = False
 
-    def write(
+        if self.columnar:  # mapped columns are adopted as they are
+            self._sort_columns()
+
+
+class _SortedList:
+    _LOAD = 1000
+
+    def __init__(
         self,
-        file: str,
-        file_type: Optional[Union[DictList.FileType, str]] = None,
+        key: Callable[[Dict[str, Any]], Any],
+        data: Iterable[Dict[str, Any]] = (),
     ) -> None:
-        self._sort()
-        super().write(file, **KWARGS(file_type=file_type))
+        self._key = key
+        self._chunks: List[List[Dict[str, Any]]] = []
+        self._maxes: List[Any] = []
+        self._offsets: Optional[List[int]] = None
+        self._len = 0
+
+        self.update(data)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return chain.from_iterable(self._chunks)
+
+    def __contains__(self, element: Dict[str, Any]) -> bool:
+        try:
+            self.index(element)
+
+        except ValueError:
+            return False
+
+        return True
+
+    @overload
+    def __getitem__(self, arg: slice, /) -> List[Dict[str, Any]]: ...
+
+    @overload
+    def __getitem__(self, arg: int, /) -> Dict[str, Any]: ...
+
+    def __getitem__(
+        self,
+        arg: Union[slice, int],
+        /,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        if isinstance(arg, slice):
+            indexes = range(self._len)[arg]
+
+            if indexes.step == 1:
+                return list(self.iterate(indexes.start, indexes.stop))
+
+            return [self[index] for index in indexes]
+
+        i, j = self._locate(range(self._len)[arg])
+        return self._chunks[i][j]
+
+    def _get_offsets(self) -> List[int]:
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(map(len, self._chunks))]
+
+        return self._offsets
+
+    def _locate(self, index: int) -> tuple:
+        offsets = self._get_offsets()
+        i = bisect_right(offsets, index) - 1
+        return i, index - offsets[i]
+
+    def iterate(self, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        if start >= stop:
+            return
+
+        i, j = self._locate(start)
+        yield from islice(
+            chain(self._chunks[i][j:], chain.from_iterable(self._chunks[i + 1 :])),
+            stop - start,
+        )
+
+    def bisect(
+        self,
+        function: Callable[[Sequence, Any], int],
+        value: Any,
+        length: Optional[int] = None,
+    ) -> int:
+        maxes, key = self._maxes, self._key
+        if length is not None:  # compare the leading fields only
+            prefix = itemgetter(slice(None, length))
+            maxes, key = _Keys(maxes, prefix), lambda e: prefix(self._key(e))
+
+        if (i := function(maxes, value)) == len(self._chunks):
+            return self._len
+
+        return self._get_offsets()[i] + function(_Keys(self._chunks[i], key), value)
+
+    def add(self, element: Dict[str, Any]) -> None:
+        key = self._key(element)
+
+        if not self._chunks:
+            self._chunks.append([element])
+            self._maxes.append(key)
+
+        elif (i := bisect_right(self._maxes, key)) == len(self._chunks):
+            self._chunks[-1].append(element)
+            self._maxes[-1] = key
+            self._split(len(self._chunks) - 1)
+
+        else:
+            chunk = self._chunks[i]
+            chunk.insert(bisect_right(_Keys(chunk, self._key), key), element)
+            self._split(i)
+
+        self._offsets = None
+        self._len += 1
+
+    def update(self, data: Iterable[Dict[str, Any]]) -> None:
+        data = list(data)
+
+        if len(data) * 8 < self._len:
+            for element in data:
+                self.add(element)
+
+        elif data:
+            self.merge(sorted(data, key=self._key))
+
+    def merge(self, data: List[Dict[str, Any]]) -> None:
+        if not data:
+            return
+
+        # chunks entirely before the first new key are kept as they are
+        i = bisect_right(self._maxes, self._key(data[0]))
+        i = min(i, len(self._chunks) - 1) if self._chunks else 0
+
+        tail = list(chain.from_iterable(self._chunks[i:]))
+        merged = list(merge(tail, data, key=self._key)) if tail else data
+
+        del self._chunks[i:]
+        del self._maxes[i:]
+
+        for j in range(0, len(merged), self._LOAD):
+            self._chunks.append(chunk := merged[j : j + self._LOAD])
+            self._maxes.append(self._key(chunk[-1]))
+
+        self._offsets = None
+        self._len += len(data)
+
+    def _split(self, i: int) -> None:
+        if len(chunk := self._chunks[i]) > self._LOAD * 2:
+            self._chunks[i : i + 1] = [chunk[: self._LOAD], chunk[self._LOAD :]]
+            self._maxes.insert(i, self._key(chunk[self._LOAD - 1]))
+
+    def index(self, element: Dict[str, Any]) -> int:
+        try:
+            key = self._key(element)
+
+        except KeyError:
+            raise ValueError(f"{element} is not in list")
+
+        index = self.bisect(bisect_left, key)
+        for e in self.iterate(index, self._len):
+            if self._key(e) != key:
+                break
+
+            if e is element or e == element:
+                return index
+
+            index += 1
+
+        raise ValueError(f"{element} is not in list")
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        i, j = self._locate(range(self._len)[index])
+        element = (chunk := self._chunks[i]).pop(j)
+
+        if chunk:
+            self._maxes[i] = self._key(chunk[-1])
+
+        else:
+            del self._chunks[i]
+            del self._maxes[i]
+
+        self._offsets = None
+        self._len -= 1
+        return element
+
+    def remove(self, element: Dict[str, Any]) -> None:
+        self.pop(self.index(element))
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._maxes.clear()
+        self._offsets = None
+        self._len = 0
+
+    def evict(self, count: int) -> None:
+        self._len -= count
+
+        while count and len(self._chunks[0]) <= count:
+            count -= len(self._chunks.pop(0))
+            del self._maxes[0]
+
+        if count:
+            del self._chunks[0][:count]
+
+        self._offsets = None
+
+
+class _Keys:
+    def __init__(self, data: Sequence, key: Callable[[Any], Any]) -> None:
+        self._data = data
+        self._key = key
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._key(self._data[index])
+
+
+def _get_distance(key: Any, value: Any) -> Any:
+    # composite keys are measured on their last field
+    if isinstance(key, tuple):
+        key, value = key[-1], value[-1]
+
+    if isinstance(key, _Reversed):
+        key, value = key.value, value.value
+
+    return abs(key - value)
+
+
+@total_ordering
+class _Reversed:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: "_Reversed") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
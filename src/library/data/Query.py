@@ -0,0 +1,137 @@
+from typing import Any, Callable, Dict, Iterable, Sequence
+from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from operator import eq, ne, lt, le, gt, ge
+
+from .DictList import DictList
+
+
+class Query(ABC):
+    @staticmethod
+    def col(key: str) -> "_Column":
+        return _Column(key)
+
+    def __and__(self, other: "Query") -> "Query":
+        return _And(self, other)
+
+    def __or__(self, other: "Query") -> "Query":
+        return _Or(self, other)
+
+    def __invert__(self) -> "Query":
+        return _Not(self)
+
+    @abstractmethod
+    def match(self, element: Dict[str, Any]) -> bool: ...
+
+    @abstractmethod
+    def mask(self, get_column: Callable[[str], Sequence], length: int) -> bytes: ...
+
+    def get_equalities(self) -> Dict[str, Any]:
+        return {}
+
+
+class _Column:
+    def __init__(self, key: str) -> None:
+        self._key = key
+
+    def __eq__(self, value: Any) -> Query:
+        return _Compare(self._key, eq, value)
+
+    def __ne__(self, value: Any) -> Query:
+        return _Compare(self._key, ne, value)
+
+    def __lt__(self, value: Any) -> Query:
+        return _Compare(self._key, lt, value)
+
+    def __le__(self, value: Any) -> Query:
+        return _Compare(self._key, le, value)
+
+    def __gt__(self, value: Any) -> Query:
+        return _Compare(self._key, gt, value)
+
+    def __ge__(self, value: Any) -> Query:
+        return _Compare(self._key, ge, value)
+
+    __hash__ = None
+
+    def isin(self, values: Iterable) -> Query:
+        try:
+            values = set(values)
+
+        except TypeError:  # unhashable values
+            values = list(values)
+
+        return _Compare(self._key, lambda v, values: v in values, values)
+
+    def between(self, start: Any, end: Any) -> Query:
+        return _Compare(self._key, ge, start) & _Compare(self._key, le, end)
+
+    def exists(self) -> Query:
+        return _Compare(self._key, lambda v, _: True, None)
+
+
+class _Compare(Query):
+    def __init__(self, key: str, op: Callable[[Any, Any], bool], value: Any) -> None:
+        self._key = key
+        self._op = op
+        self._value = value
+
+    def match(self, element: Dict[str, Any]) -> bool:
+        return self._key in element and self._op(element[self._key], self._value)
+
+    def mask(self, get_column: Callable[[str], Sequence], length: int) -> bytes:
+        column = get_column(self._key)
+
+        if isinstance(column, (array, memoryview)):  # typed, without missing values
+            return bytes(map(self._op, column, repeat(self._value)))
+
+        missing, op, value = DictList.MISSING, self._op, self._value
+        return bytes(v is not missing and op(v, value) for v in column)
+
+    def get_equalities(self) -> Dict[str, Any]:
+        return {self._key: self._value} if self._op is eq else {}
+
+
+class _And(Query):
+    def __init__(self, left: Query, right: Query) -> None:
+        self._left = left
+        self._right = right
+
+    def match(self, element: Dict[str, Any]) -> bool:
+        return self._left.match(element) and self._right.match(element)
+
+    def mask(self, get_column: Callable[[str], Sequence], length: int) -> bytes:
+        left = int.from_bytes(self._left.mask(get_column, length), "little")
+        right = int.from_bytes(self._right.mask(get_column, length), "little")
+        return (left & right).to_bytes(length, "little")
+
+    def get_equalities(self) -> Dict[str, Any]:
+        return {**self._right.get_equalities(), **self._left.get_equalities()}
+
+
+class _Or(Query):
+    def __init__(self, left: Query, right: Query) -> None:
+        self._left = left
+        self._right = right
+
+    def match(self, element: Dict[str, Any]) -> bool:
+        return self._left.match(element) or self._right.match(element)
+
+    def mask(self, get_column: Callable[[str], Sequence], length: int) -> bytes:
+        left = int.from_bytes(self._left.mask(get_column, length), "little")
+        right = int.from_bytes(self._right.mask(get_column, length), "little")
+        return (left | right).to_bytes(length, "little")
+
+
+class _Not(Query):
+    _TABLE = bytes([1]) + bytes(255)
+
+    def __init__(self, query: Query) -> None:
+        self._query = query
+
+    def match(self, element: Dict[str, Any]) -> bool:
+        return not self._query.match(element)
+
+    def mask(self, get_column: Callable[[str], Sequence], length: int) -> bytes:
+        return self._query.mask(get_column, length).translate(self._TABLE)
@@ -20,21 +20,33 @@ class Interval:
 
         attrs = KWARGS_STR(file=self._file, name=self._name)
         self._values: DictList = DictList(name=f"{self.__class__.__name__}({attrs})")
+        self._values.extend(
+            [
+                {"value": value, "count": count, "records": []}
+                for value, count in (
+                    {arg: 1} if isinstance(arg, int) or isinstance(arg, float) else arg
+                ).items()
+            ]
+        )
+
+        # journal of wait moments, flushed incrementally on each wait
+        self._records: Union[DictList, None] = None
 
         if self._file is not None:
-            self._values.read(self._file, DictList.FileType.DICTLIST)
-
-        if not self._values:
-            self._values.extend(
-                [
-                    {"value": value, "count": count, "records": []}
-                    for value, count in (
-                        {arg: 1}
-                        if isinstance(arg, int) or isinstance(arg, float)
-                        else arg
-                    ).items()
-                ]
+            records = sorted(
+                {
+                    record
+                    for element in DictList.iter_file(
+                        self._file, DictList.FileType.DICTLIST
+                    )
+                    for record in element.get("records", [element.get("time")])
+                    if record is not None
+                }
             )
+            self._records = DictList([{"time": record} for record in records])
+
+            for v in self._values:
+                v["records"] = records[-v["count"] :]
 
     def _moment(self) -> Union[int, float]:
         now = time()
@@ -82,7 +94,13 @@ class Interval:
         now = time()
         LOOP(v["records"].append(now) for v in self._values)
 
-        if self._file is not None:
-            self._values.write(self._file, DictList.FileType.DICTLIST)
+        if self._records is not None:
+            self._records.append({"time": now})
+
+            count = max(v["count"] for v in self._values)
+            if len(self._records) > 2 * count:
+                self._records = DictList(self._records[-count:])
+
+            self._records.flush(self._file, DictList.FileType.DICTLIST)
 
         return max(moment, 0)
@@ -1,8 +1,12 @@
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, Iterator, List, Tuple, Union
 from enum import Enum
-from multiprocessing import cpu_count, Queue
+from multiprocessing import cpu_count, Pipe
 from multiprocessing import Process as Process_
-from queue import Empty
+from multiprocessing.connection import Connection, wait
+from multiprocessing.resource_tracker import ensure_running
+from multiprocessing.shared_memory import SharedMemory
+from os import name as os_name
+from time import perf_counter
 from tqdm import tqdm
 
 from .macro import ATTR, LOOP, KWARGS_STR
@@ -23,10 +27,73 @@ class Process:
         def kwargs(self):
             return self._kwargs
 
+    class Shared:
+        # pickles as the name of a shared memory block instead of a copy of the data
+        def __init__(self, data) -> None:
+            self._memory, self._views, self._owner = None, [], False
+
+            view = memoryview(data)
+
+            self._format = view.format
+            self._shape = view.shape
+            self._size = view.nbytes
+
+            self._memory = SharedMemory(create=True, size=max(self._size, 1))
+
+            # the creator unlinks the block, however many bundles refer to it
+            self._owner = True
+            self._memory.buf[: self._size] = view.cast("B")
+
+        def __getstate__(self):
+            # results created by a worker are handed over to the receiving process
+            transfer = self._owner and _WORKER
+            if transfer:
+                self._owner = False
+
+            return self._memory.name, self._format, self._shape, self._size, transfer
+
+        def __setstate__(self, state) -> None:
+            self._memory, self._views, self._owner = None, [], False
+
+            name, self._format, self._shape, self._size, owner = state
+
+            self._memory = SharedMemory(name)
+            self._owner = owner
+
+        def __del__(self):
+            self.close()
+
+        @property
+        def data(self) -> memoryview:
+            if not self._views:
+                self._views.append(self._memory.buf[: self._size])
+
+                # memoryview cannot cast to a shape containing zeros
+                if self._size:
+                    self._views.append(self._views[0].cast(self._format, self._shape))
+
+            return self._views[-1]
+
+        def close(self) -> None:
+            while self._views:
+                self._views.pop().release()
+
+            if self._memory is None:
+                return
+
+            self._memory.close()
+
+            if self._owner:
+                self._memory.unlink()
+                self._owner = False
+
     def __init__(self, count: int = cpu_count(), name: Optional[str] = None):
         self._name = name
         self._trace = ATTR(Process, "trace", lambda: Trace("core"))
 
+        # started before the fork so every process shares one tracker for Shared
+        if os_name == "posix":
+            ensure_running()
         self._processes = [_Process() for _ in range(count)]
 
     def __enter__(self):
@@ -66,66 +133,183 @@ class Process:
         self,
         target: Callable,
         bundles: List[Bundle],
-        unit: int = 100,
+        unit: Union[int, str] = 100,
         silent: bool = False,
+        batch: Optional[int] = None,
     ) -> List:
-        portions = [
-            bundles[i * unit : (i + 1) * unit]
-            for i in range((len(bundles) + unit - 1) // unit)
-        ]
+        return list(
+            self.imap(target, bundles, unit, ordered=False, silent=silent, batch=batch)
+        )
+
+    def imap(
+        self,
+        target: Callable,
+        bundles: List[Bundle],
+        unit: Union[int, str] = 100,
+        ordered: bool = True,
+        silent: bool = False,
+        batch: Optional[int] = None,
+    ) -> Iterator:
+        if not (unit == "auto" or (isinstance(unit, int) and unit > 0)):
+            err = f"Invalid unit: {unit}"
+            self._trace.critical(err)
+            raise ValueError(err)
+
+        if batch is not None and not (isinstance(batch, int) and batch > 0):
+            err = f"Invalid batch: {batch}"
+            self._trace.critical(err)
+            raise ValueError(err)
 
         self._trace.debug(
-            f"execute {len(portions)} portions"
-            + f" for {len(bundles)} bundles"
-            + f" in by {len(self)} processes"
+            f"execute {len(bundles)} bundles"
+            + f" in {unit} units"
+            + f" by {len(self)} processes"
         )
 
-        results = []
+        # ordered results wait for the head portion, so bound the portions ahead of it
+        window = len(self) * 2 if ordered else len(bundles)
+
+        units = _Unit(unit, len(self))
+        running: Dict[_Process, Tuple[int, int, float]] = {}
+        buffers: Dict[int, List] = {}
+        done = set()
+        head = sent = offset = 0
+
         with tqdm(
             total=len(bundles),
             leave=False,
             dynamic_ncols=True,
             disable=silent,
         ) as progress:
-            while len(results) != len(bundles):
-                for process, portion in zip(
-                    [process for process in self._processes if process.idle()],
-                    portions,
-                ):
-                    if not process.execute(target, portion):
-                        err = "Execute failed"
-                        self._trace.critical(err)
-                        self.print(critical=True)
-                        raise ValueError(err)
-
-                    portions.remove(portion)
-
-                for process in [
-                    process for process in self._processes if not process.idle()
-                ]:
-                    data = process.get()
-                    if data is None:
-                        err = "Execute failed"
-                        self._trace.critical(err)
-                        self.print(critical=True)
-                        raise ValueError(err)
-
-                    if data:
-                        results.extend(data)
+            try:
+                while offset != len(bundles) or head != sent:
+                    for process in [p for p in self._processes if p.idle()]:
+                        if offset == len(bundles) or sent - head >= window:
+                            break
+
+                        count = units.get(len(bundles) - offset)
+                        portion = bundles[offset : offset + count]
+
+                        try:
+                            executed = process.execute(target, portion, batch)
+
+                        except Exception as e:  # e.g. unpicklable target or bundles
+                            self._drain()
+
+                            err = f"Execute failed: {e!r}"
+                            self._trace.critical(err)
+                            raise ValueError(err) from e
+
+                        if not executed:
+                            err = "Execute failed"
+                            self._trace.critical(err)
+                            self.print(critical=True)
+                            raise ValueError(err)
+
+                        running[process] = (sent, len(portion), perf_counter())
+                        buffers[sent] = []
+                        offset += len(portion)
+                        sent += 1
+
+                    for process, data in self._wait():
+                        index, count, start = running[process]
                         progress.update(len(data))
 
+                        if ordered:
+                            buffers[index].extend(data)
+
+                        else:
+                            yield from data
+
+                        if process.idle():
+                            units.add(count, perf_counter() - start)
+                            del running[process]
+                            done.add(index)
+
+                    while head in buffers:
+                        yield from buffers[head]
+                        buffers[head].clear()
+
+                        if head not in done:
+                            break
+
+                        del buffers[head]
+                        done.remove(head)
+                        head += 1
+
+            except GeneratorExit:
+                self._drain()
+                raise
+
+    def _wait(self) -> List[Tuple["_Process", List]]:
+        # block until a busy process responds or dies, instead of polling
+        busy = [process for process in self._processes if not process.idle()]
+        wait(
+            [process.reader for process in busy]
+            + [process.sentinel for process in busy]
+        )
+
+        results = []
+        for process in busy:
+            data = process.get()
+            if data is None:
+                err = "Execute failed"
+                self._trace.critical(err)
+                self.print(critical=True)
+                raise ValueError(err)
+
+            results.append((process, data))
+
         return results
 
+    def _drain(self) -> None:
+        # discard the results of an abandoned imap so the processes can be reused
+        while any(not process.idle() for process in self._processes):
+            self._wait()
+
+
+class _Unit:
+    # guided self-scheduling toward a target time per portion
+    _TARGET = 0.1
+
+    def __init__(self, unit: Union[int, str], processes: int) -> None:
+        self._unit = unit
+        self._processes = processes
+
+        self._count = 0
+        self._time = 0.0
+
+    def get(self, remaining: int) -> int:
+        if self._unit != "auto":
+            return self._unit
+
+        if not self._count:  # probe the latency with single bundles
+            return 1
+
+        unit = int(self._TARGET * self._count / self._time) if self._time else remaining
+
+        # shrink the tail portions so the processes finish together
+        return max(min(unit, -(-remaining // (self._processes * 2))), 1)
+
+    def add(self, count: int, time: float) -> None:
+        self._count += count
+        self._time += time
+
 
 class _Process:
     def __init__(self) -> None:
-        self._request = Queue()
-        self._response = Queue()
+        # pipes pickle on send, so unpicklable requests raise here instead of hanging
+        request, self._request = Pipe(duplex=False)
+        self._response, response = Pipe(duplex=False)
 
-        self._process = Process_(target=_process, args=(self._request, self._response))
+        self._process = Process_(target=_process, args=(request, response))
         self._process.start()
         self._state = _State.IDLE
 
+        # kept by the process only, so its exit reads as EOF
+        request.close()
+        response.close()
+
         self._bundles = 0
         self._results = []
 
@@ -140,7 +324,7 @@ class _Process:
         if self._state != _State.IDLE:
             return False
 
-        self._request.put(_Command.CLOSE)
+        self._request.send(_Command.CLOSE)
         self._state = _State.UNKNOWN
 
         return True
@@ -149,21 +333,38 @@ class _Process:
         if self._state != _State.UNKNOWN:
             return False
 
-        message = self._response.get()
+        try:
+            message = self._response.recv()
+
+        except EOFError:
+            return False
+
         if not (isinstance(message, _State) and message == _State.CLOSED):
             return False
 
         self._state = _State.CLOSED
         return True
 
+    @property
+    def reader(self) -> Connection:
+        return self._response
+
+    @property
+    def sentinel(self) -> int:
+        return self._process.sentinel
+
     def idle(self) -> bool:
         return self._state == _State.IDLE
 
-    def execute(self, target: Callable, bundles: List) -> bool:
+    def execute(
+        self, target: Callable, bundles: List, batch: Optional[int] = None
+    ) -> bool:
         if self._state != _State.IDLE:
             return False
 
-        self._request.put(_Request(target, bundles))
+        # plain tuples pickle smaller and faster than bundle objects
+        bundles = [(bundle.args, bundle.kwargs) for bundle in bundles]
+        self._request.send(_Request(target, bundles, batch or len(bundles)))
         self._state = _State.BUSY
 
         self._bundles = len(bundles)
@@ -176,17 +377,21 @@ class _Process:
 
         results = []
 
-        try:
-            while self._bundles and (message := self._response.get(block=False)):
-                if isinstance(message, _Result):
-                    results.append(message.result)
-                    self._bundles -= 1
+        while self._bundles and self._response.poll():
+            try:
+                message = self._response.recv()
+
+            except EOFError:  # the process exited
+                return None
 
-                else:
-                    return None
+            if not isinstance(message, _Result):
+                return None
 
-        except Empty:
-            pass
+            results.extend(message.result)
+            self._bundles -= len(message.result)
+
+        if not (results or self._process.is_alive()):
+            return None
 
         if not self._bundles:
             self._state = _State.IDLE
@@ -194,23 +399,39 @@ class _Process:
         return results
 
 
-def _process(request: Queue, response: Queue) -> None:
-    while message := request.get():
+_WORKER = False
+
+
+def _process(request: Connection, response: Connection) -> None:
+    global _WORKER
+    _WORKER = True
+
+    while message := request.recv():
         if isinstance(message, _Request):
             try:
-                for bundle in message.bundles:
-                    response.put(_Result(message.target(*bundle.args, **bundle.kwargs)))
+                target, bundles, batch = message.target, message.bundles, message.batch
+
+                # send results back in batches to amortize pickling and pipe writes
+                for i in range(0, len(bundles), batch):
+                    response.send(
+                        _Result(
+                            [
+                                target(*args, **kwargs)
+                                for args, kwargs in bundles[i : i + batch]
+                            ]
+                        )
+                    )
 
             except Exception as e:
-                response.put(_State.EXCEPTION)
+                response.send(_State.EXCEPTION)
                 return
 
         elif isinstance(message, _Command) and message == _Command.CLOSE:
-            response.put(_State.CLOSED)
+            response.send(_State.CLOSED)
             break
 
         else:
-            response.put(_State.UNKNOWN)
+            response.send(_State.UNKNOWN)
             return
 
 
@@ -227,9 +448,10 @@ class _State(Enum):
 
 
 class _Request:
-    def __init__(self, target, bundles) -> None:
+    def __init__(self, target, bundles, batch) -> None:
         self._target = target
         self._bundles = bundles
+        self._batch = batch
 
     @property
     def target(self):
@@ -239,6 +461,10 @@ class _Request:
     def bundles(self):
         return self._bundles
 
+    @property
+    def batch(self):
+        return self._batch
+
 
 class _Result:
     def __init__(self, result) -> None:
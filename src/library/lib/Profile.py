@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, Optional
+from array import array
+from random import randrange
+from time import perf_counter
+
+from .Math import Math
+
+
+class Profile:  # timing wrapper of a handle
+    SIZE = 1024  # times sampled for the percentiles
+
+    def __init__(self, handle: Optional[Callable], name: Optional[str] = None):
+        self._handle = handle
+        self._name = name if name else self.get_name(handle)
+
+        self._count = 0
+        self._total = 0.0
+        self._times = array("d")  # reservoir sample, bounded for long-running use
+
+    @staticmethod
+    def get_name(handle: Callable) -> str:
+        return getattr(handle, "__name__", str(handle))
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __call__(self, *args: Any) -> Any:
+        start = perf_counter()
+        try:
+            return self._handle(*args)
+
+        finally:
+            self.add(perf_counter() - start)
+
+    def add(self, time: float) -> None:
+        self._count += 1
+        self._total += time
+
+        if len(self._times) < self.SIZE:
+            self._times.append(time)
+
+        elif (index := randrange(self._count)) < self.SIZE:
+            self._times[index] = time
+
+    def get(self) -> Dict[str, Any]:
+        times = sorted(self._times)
+        percentile = lambda q: (
+            times[min(int(q * len(times)), len(times) - 1)] if times else None
+        )
+
+        return {
+            "name": self._name,
+            "count": self._count,
+            "total": self._total,
+            "mean": Math.ratio(self._total, self._count),
+            "p50": percentile(0.5),
+            "p99": percentile(0.99),
+        }
@@ -1,10 +1,14 @@
 from unittest import TestCase
+from io import StringIO
 from copy import deepcopy
 from random import randint
 from os import remove
-from os.path import join, abspath, dirname
+from os.path import join, abspath, dirname, getsize
 from tempfile import mktemp
+from array import array
+from datetime import datetime
 
+from src.library.lib.Math import Math
 from src.library.data.DictList import DictList
 
 
@@ -209,6 +213,129 @@ class TestDictList(TestCase):
         self.data.clear()
         self.assertEqual(len(self.data._data), 0)
 
+    def test_evict(self):
+        data = DictList(deepcopy(self.source), indexes=["name"])
+        data.evict(2)
+        self.assertListEqual(data.get_data(), self.source[2:])
+        self.assertIsNone(data.get_element("name", self.source[0]["name"]))
+
+        data = DictList(deepcopy(self.source), columnar=True)
+        data.evict(1)
+        self.assertListEqual([e for e in data], self.source[1:])
+
+    def test_indexes(self):
+        data = DictList(deepcopy(self.source), indexes=["name"])
+        self.assertListEqual(data.get_indexes(), ["name"])
+        self.assertEqual(data.get_element("name", "Jane"), self.source[1])
+        self.assertEqual(data.get_element({"name": "Jane", "age": 25}), self.source[1])
+        self.assertIsNone(data.get_element({"name": "Jane", "age": 10}))
+        self.assertEqual(data.get_data("name", "Doe"), [self.source[2]])
+
+        data.create_index("age")
+        self.assertListEqual(data.get_indexes(), ["name", "age"])
+        self.assertEqual(data.get_element("age", 22), self.source[2])
+
+        data.drop_index("name")
+        self.assertListEqual(data.get_indexes(), ["age"])
+        self.assertEqual(data.get_element("name", "John"), self.source[0])
+
+    def test_indexes_update(self):
+        data = DictList(deepcopy(self.source), indexes=["name", "age"])
+
+        data.append({"name": "Smith", "age": 40})
+        data.extend([{"name": "Alice", "age": 26}, {"name": "Jane", "age": 24}])
+        self.assertEqual(
+            data.get_element("name", "Smith"), {"name": "Smith", "age": 40}
+        )
+        self.assertEqual(len(data.get_data("name", "Jane")), 2)
+        self.assertEqual(data.get_element("name", "Jane"), self.source[1])
+
+        data.insert({"name": "Jane", "age": 20}, index=0)
+        self.assertEqual(data.get_element("name", "Jane"), {"name": "Jane", "age": 20})
+        self.assertEqual(data.get_data({"name": "Jane", "age": 24}), [data[-1]])
+
+        data.remove({"name": "Jane", "age": 20})
+        self.assertEqual(data.get_element("name", "Jane"), self.source[1])
+
+        data.pop(1)
+        self.assertEqual(data.get_element("name", "Jane"), {"name": "Jane", "age": 24})
+
+        data.extend({"name": "Bob", "age": age} for age in (30, 31))
+        self.assertEqual(len(data.get_data("name", "Bob")), 2)
+        self.assertIsNone(data.get_element("age", 25))
+
+        data.clear()
+        self.assertIsNone(data.get_element("name", "Jane"))
+        self.assertListEqual(data.get_data("name", "Jane"), [])
+
+        data.read(F_DICTLIST_DICTLIST)
+        self.assertEqual(data.get_element("age", 25), self.source[1])
+
+    def test_columnar(self):
+        data = DictList(deepcopy(self.source), columnar=True)
+        self.assertTrue(data.columnar)
+        self.assertFalse(self.data.columnar)
+        self.assertEqual(len(data), len(self.source))
+        self.assertListEqual([e for e in data], self.source)
+        self.assertEqual(data[1], self.source[1])
+        self.assertListEqual(data[1:], self.source[1:])
+        self.assertListEqual(data.get_data(), self.source)
+
+        self.assertIsInstance(data.get_column("age"), array)
+        self.assertListEqual(data.get_column("age").tolist(), [30, 25, 22])
+        self.assertListEqual(data.get_column("name"), ["John", "Jane", "Doe"])
+
+        with self.assertRaises(TypeError):
+            DictList(deepcopy(self.source), indexes=["name"], columnar=True)
+
+        with self.assertRaises(TypeError):
+            data.create_index("name")
+        self.assertListEqual(data.get_values("age"), [30, 25, 22])
+        self.assertEqual(len(data.get_filtered_data("age", start=25)), 2)
+        self.assertEqual(data.get_element("name", "Jane"), self.source[1])
+
+        with self.assertRaises(TypeError):
+            self.data.get_column("age")
+
+    def test_columnar_update(self):
+        data = DictList(deepcopy(self.source), columnar=True)
+
+        data.append({"name": "Smith", "age": 40.5, "city": "Seoul"})
+        self.assertEqual(data[-1], {"name": "Smith", "age": 40.5, "city": "Seoul"})
+        self.assertEqual(data[0], self.source[0])
+        self.assertListEqual(data.get_column("age"), [30, 25, 22, 40.5])
+        self.assertListEqual(
+            data.get_column("city"),
+            [DictList.MISSING, DictList.MISSING, DictList.MISSING, "Seoul"],
+        )
+        self.assertListEqual(data.get_values("city"), ["Seoul"])
+
+        data.insert({"name": "Charlie"}, index=1)
+        self.assertEqual(data[1], {"name": "Charlie"})
+
+        data.remove({"name": "Charlie"})
+        self.assertEqual(data.pop(3), {"name": "Smith", "age": 40.5, "city": "Seoul"})
+        self.assertListEqual([e for e in data], self.source)
+
+        data.clear()
+        self.assertEqual(len(data), 0)
+
+    def test_columnar_write(self):
+        data = DictList(deepcopy(self.source), columnar=True)
+
+        file = mktemp()
+        data.write(file, DictList.FileType.DICTLIST)
+        self.assertTrue(_compare(file, F_DICTLIST_DICTLIST))
+        remove(file)
+
+        file = mktemp()
+        data.write(file, DictList.FileType.JSON)
+        self.assertTrue(_compare(file, F_JSON_JSON))
+        remove(file)
+
+        data = DictList(F_DICTLIST_DICTLIST, columnar=True)
+        self.assertListEqual([e for e in data], self.source)
+
     def test_read(self):
         data = DictList()
         data.read(F_DICTLIST_DICTLIST)
@@ -249,6 +376,228 @@ class TestDictList(TestCase):
         for index, element in enumerate(data):
             self.assertEqual(element, self.source[index])
 
+    def test_group_by(self):
+        source = [
+            {"code": "A", "close": 10, "volume": 1.0},
+            {"code": "B", "close": 20, "volume": 2.0},
+            {"code": "A", "close": 30, "volume": 3.0},
+            {"code": "B", "close": 40},
+            {"code": "A", "close": 50, "volume": 5.0},
+        ]
+
+        for data in (DictList(source), DictList(source, columnar=True)):
+            groups = data.group_by("code").agg(
+                {
+                    "close": "max",
+                    "low": ("close", "min"),
+                    "first": ("close", "first"),
+                    "last": ("close", "last"),
+                    "count": ("volume", "count"),
+                    "volume": "sum",
+                    "average": ("close", Math.average),
+                    "deviation": ("close", "standard_deviation"),
+                    "values": ("close", lambda values: values),
+                }
+            )
+            self.assertIsInstance(groups, DictList)
+            self.assertEqual(len(groups), 2)
+
+            a, b = groups.get_element("code", "A"), groups.get_element("code", "B")
+            self.assertEqual(a["close"], 50)
+            self.assertEqual(a["low"], 10)
+            self.assertEqual(a["first"], 10)
+            self.assertEqual(a["last"], 50)
+            self.assertEqual(a["count"], 3)
+            self.assertEqual(b["count"], 1)
+            self.assertEqual(a["volume"], 9.0)
+            self.assertEqual(b["volume"], 2.0)
+            self.assertAlmostEqual(a["average"], Math.average([10, 30, 50]))
+            self.assertAlmostEqual(
+                a["deviation"], Math.standard_deviation([10, 30, 50])
+            )
+            self.assertListEqual(b["values"], [20, 40])
+
+    def test_group_by_functions(self):
+        groups = self.data.group_by([], {"adult": lambda e: e["age"] >= 25}).agg(
+            {"count": ("name", "count"), "age": "average"}
+        )
+        self.assertListEqual(
+            groups.get_data(),
+            [
+                {"adult": True, "count": 2, "age": 27.5},
+                {"adult": False, "count": 1, "age": 22.0},
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            self.data.group_by("name").agg({"age": "median"})
+
+    def test_iter_file(self):
+        data = [e for e in DictList.iter_file(F_DICTLIST_DICTLIST)]
+        self.assertListEqual(data, self.source)
+
+        data = [e for e in DictList.iter_file(F_CSV_CSV)]
+        for element in data:
+            element["age"] = int(element["age"])
+
+        self.assertListEqual(data, self.source)
+
+        data = [e for e in DictList.iter_file(F_JSON_JSON)]
+        self.assertListEqual(data, self.source)
+
+        data = [e for e in DictList.iter_file(F_DICTLIST, "DictList")]
+        self.assertListEqual(data, self.source)
+
+        data = [e for e in DictList.iter_file(mktemp(), DictList.FileType.JSON)]
+        self.assertListEqual(data, [])
+
+    def test_iter_file_chunk(self):
+        for file in (F_DICTLIST_DICTLIST, F_CSV_CSV, F_JSON_JSON):
+            chunks = [chunk for chunk in DictList.iter_file(file, chunk_size=2)]
+            self.assertListEqual([len(chunk) for chunk in chunks], [2, 1])
+            self.assertListEqual(
+                [e["name"] for chunk in chunks for e in chunk],
+                [e["name"] for e in self.source],
+            )
+
+    def test_iter_file_pickle(self):
+        source = [{"index": i} for i in range(DictList._FRAME * 2 + 1)]
+
+        file = mktemp()
+        DictList(deepcopy(source)).write(file, DictList.FileType.DICTLIST)
+        with open(file, "rb") as f:
+            elements = DictList._iter_pickle(f)
+            self.assertEqual(next(elements), source[0])
+            self.assertLess(f.tell(), getsize(file) // 2)
+            self.assertListEqual([source[0], *elements], source)
+
+        self.assertListEqual(
+            DictList(file, DictList.FileType.DICTLIST).get_data(), source
+        )
+        remove(file)
+
+    def test_iter_file_json(self):
+        source = [{"index": i, "name": "name" * i} for i in range(100)]
+
+        file = mktemp()
+        DictList(deepcopy(source)).write(file, DictList.FileType.JSON)
+        with open(file, "r", encoding="UTF-8-sig") as f:
+            self.assertListEqual([e for e in DictList._iter_json(f, 16)], source)
+
+        remove(file)
+
+        for text in ('[{"a": 1}', '[{"a": 1},, {"a": 2}]', '{"a": 1}', "[] []"):
+            with self.assertRaises(ValueError):
+                [e for e in DictList._iter_json(StringIO(text), 4)]
+
+        self.assertListEqual([e for e in DictList._iter_json(StringIO(" [ ] "))], [])
+
+    def test_columns_file(self):
+        source = [
+            {
+                "datetime": datetime(2024, 1, 1 + i, 9),
+                "close": 1000 + i,
+                "volume": 0.5 * i,
+                "code": f"code{i % 2}",
+            }
+            for i in range(10)
+        ]
+        source[3]["flag"] = True
+
+        file = mktemp()
+        DictList(deepcopy(source)).write(file, DictList.FileType.COLUMNS)
+
+        data = DictList(file, DictList.FileType.COLUMNS, columnar=True)
+        self.assertIsInstance(data.get_column("close"), memoryview)
+        self.assertListEqual(data.get_column("close").tolist(), list(range(1000, 1010)))
+        self.assertEqual(data.get_column("datetime")[2], datetime(2024, 1, 3, 9))
+        self.assertIsInstance(data.get_column("datetime"), list)
+        self.assertListEqual([e for e in data], source)
+        self.assertEqual(data[3], source[3])
+
+        data = DictList(file, DictList.FileType.COLUMNS)
+        self.assertFalse(data.columnar)
+        self.assertListEqual(data.get_data(), source)
+
+        chunks = [c for c in DictList.iter_file(file, "columns", chunk_size=4)]
+        self.assertListEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+        data = DictList(file, DictList.FileType.COLUMNS, columnar=True)
+        data.append({"close": 0, "datetime": datetime(2023, 1, 1)})
+        self.assertIsInstance(data.get_column("close"), array)
+        self.assertEqual(data[-1], {"close": 0, "datetime": datetime(2023, 1, 1)})
+
+        data.write(file, DictList.FileType.COLUMNS)
+        self.assertListEqual(
+            [e for e in DictList(file, DictList.FileType.COLUMNS)],
+            source + [{"close": 0, "datetime": datetime(2023, 1, 1)}],
+        )
+        remove(file)
+
+        file = mktemp()
+        with open(file, "wb") as f:
+            f.write(b"invalid file")
+
+        with self.assertRaises(ValueError):
+            DictList(file, DictList.FileType.COLUMNS)
+
+        remove(file)
+
+    def test_flush(self):
+        for file_type in (
+            DictList.FileType.DICTLIST,
+            DictList.FileType.CSV,
+            DictList.FileType.JSONL,
+        ):
+            file = mktemp()
+            data = DictList([{"name": "John", "age": "30"}])
+
+            data.flush(file, file_type)
+            data.append({"name": "Jane", "age": "25"})
+            data.flush(file, file_type)
+            data.extend([{"name": "Doe", "age": "22"}])
+            data.flush(file, file_type)
+
+            self.assertEqual(data._journal["frames"], 2)
+            self.assertListEqual(DictList(file, file_type).get_data(), data.get_data())
+
+            data.pop(0)
+            data.flush(file, file_type)
+            self.assertEqual(data._journal["frames"], 0)
+            self.assertListEqual(DictList(file, file_type).get_data(), data.get_data())
+            remove(file)
+
+    def test_flush_compaction(self):
+        file = mktemp()
+        data = DictList()
+        for index in range(5):
+            data.append({"index": index})
+            data.flush(file, DictList.FileType.DICTLIST, compaction=2)
+
+        self.assertEqual(data._journal["frames"], 1)
+        self.assertListEqual(
+            DictList(file, DictList.FileType.DICTLIST).get_data(),
+            [{"index": index} for index in range(5)],
+        )
+        remove(file)
+
+    def test_flush_csv_keys(self):
+        file = mktemp()
+        data = DictList([{"name": "John"}])
+        data.flush(file, DictList.FileType.CSV)
+        data.append({"name": "Jane", "age": "25"})
+        data.flush(file, DictList.FileType.CSV)
+
+        self.assertEqual(data._journal["frames"], 0)
+        self.assertListEqual(
+            DictList(file, DictList.FileType.CSV).get_data(),
+            [{"name": "John"}, {"name": "Jane", "age": "25"}],
+        )
+        remove(file)
+
+        with self.assertRaises(TypeError):
+            data.flush(file, DictList.FileType.JSON)
+
     def test_write(self):
         file = mktemp()
         self.data.write(file, DictList.FileType.DICTLIST)
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from typing import Dict
+from typing import Dict, List
 from copy import deepcopy
 from random import randint
 from os import remove
@@ -7,6 +7,7 @@ from os.path import join, abspath, dirname
 from tempfile import mktemp
 
 from src.library.lib.Trace import Trace
+from src.library.lib.Process import Process
 from src.library.data.HandledDictList import HandledDictList
 from .test_DictList import (
     F_DICTLIST_DICTLIST,
@@ -244,6 +245,31 @@ class TestHandledDictList(TestCase):
         with self.assertRaises(TypeError):
             self.data.clear()
 
+    def test_indexes(self):
+        data = HandledDictList(
+            [_name_handle, _age_handle],
+            deepcopy(self.source),
+            indexes=["name"],
+        )
+        self.assertIsNone(data.get_element("name", "John"))
+        self.assertEqual(
+            data.get_element("name", "John_handled"),
+            self.source_handled[0],
+        )
+
+        data.append({"name": "Smith", "age": 40})
+        self.assertEqual(
+            data.get_element("name", "Smith_handled"),
+            {"name": "Smith_handled", "age": 41},
+        )
+
+        data.extend({"name": "Smith", "age": age} for age in (50, 60))
+        self.assertEqual(len(data.get_data("name", "Smith_handled")), 3)
+        self.assertIsNone(data.get_element("name", "Smith"))
+
+        data.create_index("age")
+        self.assertEqual(data.get_data("age", 61), [data[-1]])
+
     def test_read(self):
         data = HandledDictList([_name_handle, _age_handle])
         data.read(F_DICTLIST_DICTLIST)
@@ -309,6 +335,85 @@ class TestHandledDictList(TestCase):
         for index, element in enumerate(data):
             self.assertEqual(element, source_handled[index])
 
+    def test_batch(self):
+        calls = []
+
+        def _total_handle(data, pipes) -> List[Dict]:
+            calls.append(len(data))
+            return [{"total": sum(e["age"] for e in data)} for _ in data]
+
+        def _share_handle(element, pipe) -> None:
+            element["share"] = element["age"] / pipe["total"]
+
+        data = HandledDictList(
+            [_age_handle, HandledDictList.Batch(_total_handle), _share_handle],
+            deepcopy(self.source),
+        )
+        self.assertListEqual(data.get_values("share"), [31 / 80, 26 / 80, 23 / 80])
+
+        data.extend([{"name": "Alice", "age": 9}, {"name": "Bob", "age": 9}])
+        self.assertListEqual(data.get_values("share")[3:], [0.5, 0.5])
+        self.assertListEqual(calls, [3, 2])
+
+    def test_profile(self):
+        data = HandledDictList(
+            [_name_handle, HandledDictList.Batch(lambda data, pipes: None)],
+            deepcopy(self.source),
+            profile=True,
+        )
+        data.append({"name": "Smith", "age": 40})
+
+        stats = data.stats()
+        self.assertListEqual([s["name"] for s in stats], ["_name_handle", "<lambda>"])
+        self.assertListEqual([s["count"] for s in stats], [4, 2])
+        self.assertLessEqual(stats[0]["p50"], stats[0]["p99"])
+        self.assertAlmostEqual(stats[0]["mean"], stats[0]["total"] / 4)
+        self.assertEqual(data[3]["name"], "Smith_handled")
+
+        self.assertListEqual(self.data.stats(), [])
+
+    def test_partition(self):
+        source = [{"code": i % 3, "value": i} for i in range(30)]
+        process = Process(2)
+        data = HandledDictList(
+            [HandledDictList.Batch(_total_handle)],
+            deepcopy(source),
+            partition="code",
+            process=process,
+        )
+        data.extend([{"code": 1, "value": 30}, {"code": 4, "value": 31}])
+        del process
+
+        self.assertListEqual(data.get_values("value"), list(range(32)))
+        self.assertListEqual(
+            [e["total"] for e in data if e["code"] == 0],
+            [sum(range(0, i + 1, 3)) for i in range(0, 30, 3)],
+        )
+        self.assertListEqual([e["total"] for e in data][-2:], [30, 31])
+
+        with self.assertRaises(ValueError):
+            HandledDictList([_age_handle], partition="code")
+
+        process = Process(2)
+        with self.assertRaises(ValueError):
+            HandledDictList(
+                [lambda e, p: None], deepcopy(source), partition="code", process=process
+            )
+
+        del process
+
+    def test_checkpoint(self):
+        file = mktemp()
+        self.data.checkpoint(file)
+
+        data = HandledDictList([_name_handle, _age_handle])
+        data.restore(file)
+        self.assertListEqual(data.get_data(), self.source_handled)
+
+        data.append({"name": "Smith", "age": 40})
+        self.assertEqual(data[3], {"name": "Smith_handled", "age": 41})
+        remove(file)
+
 
 def _compare(file1, file2):
     with open(file1, "rb") as f1, open(file2, "rb") as f2:
@@ -321,3 +426,10 @@ def _name_handle(element: Dict, pipe: Dict) -> None:
 
 def _age_handle(element: Dict, pipe: Dict) -> None:
     element["age"] += 1
+
+
+def _total_handle(data: List[Dict], pipes: List[Dict]) -> None:
+    total = 0
+    for element in data:
+        total += element["value"]
+        element["total"] = total
@@ -1,5 +1,8 @@
 from unittest import TestCase
-from datetime import datetime
+from copy import deepcopy
+from datetime import datetime, timedelta
+from os import remove
+from tempfile import mktemp
 
 from src.library.lib.Trace import Trace
 from src.library.data.DictList import DictList
@@ -19,6 +22,11 @@ class TestLinkedDictList(TestCase):
         data = LinkedDictList("datetime", [])
         self.assertIsInstance(data, LinkedDictList)
 
+        with self.assertRaises(TypeError):
+            LinkedDictList(
+                "datetime", [LinkedDictList.Node(DictList(columnar=True), [])]
+            )
+
     def test_len(self):
         data = LinkedDictList(
             "datetime",
@@ -181,6 +189,263 @@ class TestLinkedDictList(TestCase):
         with self.assertRaises(KeyError):
             self.assertEqual(second[3]["count"], 11)
 
+    def test_handle_waiting(self):
+        global count
+        count = 0
+
+        first = DictList(name="first")
+        second = DictList(name="second")
+        data = LinkedDictList(
+            "datetime",
+            [
+                LinkedDictList.Node(first, [_count]),
+                LinkedDictList.Node(second, [_count]),
+            ],
+        )
+
+        first.append({"datetime": datetime(2021, 1, 1)})
+        data.handle()
+        self.assertEqual(data[0].handled, 0)
+
+        second.append({"datetime": datetime(2021, 1, 1)})
+        data.handle()
+        self.assertEqual(first[0]["count"], 0)
+        self.assertEqual(second[0]["count"], 1)
+
+    def test_retention(self):
+        global count
+        count = 0
+
+        first = DictList(name="first")
+        second = DictList(name="second")
+        data = LinkedDictList(
+            "datetime",
+            [
+                LinkedDictList.Node(first, [_count], retention=2),
+                LinkedDictList.Node(second, [_count], duration=timedelta(days=1)),
+            ],
+        )
+
+        first.extend([{"datetime": datetime(2021, 1, d)} for d in range(1, 6)])
+        second.extend([{"datetime": datetime(2021, 1, d)} for d in range(2, 5)])
+        data.handle()
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(first[0]["count"], 5)
+        self.assertEqual(data[0].handled, 1)
+        self.assertListEqual([e["count"] for e in second], [4, 6])
+        self.assertEqual(data[1].handled, 2)
+
+        second.append({"datetime": datetime(2021, 1, 5)})
+        data.handle()
+
+        self.assertListEqual([e["count"] for e in first], [5, 7])
+        self.assertEqual(data[0].handled, 2)
+        self.assertListEqual([e["count"] for e in second], [6, 8])
+        self.assertEqual(data[1].handled, 2)
+
+    def test_resample(self):
+        minutes = DictList(name="minutes")
+        hours = DictList(name="hours")
+        base = LinkedDictList.Node(minutes, [])
+        data = LinkedDictList(
+            "datetime",
+            [LinkedDictList.Resample(hours, [], base, "hour"), base],
+        )
+
+        minutes.extend(
+            {
+                "datetime": datetime(2021, 1, 1, 9) + timedelta(minutes=30 * i),
+                "open": i,
+                "high": i + 2,
+                "low": i - 1,
+                "close": i + 1,
+                "volume": 10,
+            }
+            for i in range(5)
+        )
+        data.handle()
+
+        self.assertListEqual(
+            hours.get_data(),
+            [
+                {
+                    "datetime": datetime(2021, 1, 1, 9),
+                    "open": 0,
+                    "high": 3,
+                    "low": -1,
+                    "close": 2,
+                    "volume": 20,
+                },
+                {
+                    "datetime": datetime(2021, 1, 1, 10),
+                    "open": 2,
+                    "high": 5,
+                    "low": 1,
+                    "close": 4,
+                    "volume": 20,
+                },
+            ],
+        )
+        self.assertEqual(data[0].handled, 2)
+
+        minutes.append(
+            {
+                "datetime": datetime(2021, 1, 1, 12),
+                "open": 5,
+                "high": 5,
+                "low": 5,
+                "close": 5,
+                "volume": 1,
+            }
+        )
+        data.handle()
+
+        self.assertEqual(len(hours), 3)
+        self.assertEqual(hours[-1]["datetime"], datetime(2021, 1, 1, 11))
+        self.assertEqual(hours[-1]["volume"], 10)
+
+        # restarted over reloaded data, the emitted candles are not repeated
+        hours = DictList(deepcopy(hours.get_data()[:2]), name="hours")
+        minutes = DictList(deepcopy(minutes.get_data()[:5]), name="minutes")
+        base = LinkedDictList.Node(minutes, [])
+        data = LinkedDictList(
+            "datetime",
+            [LinkedDictList.Resample(hours, [], base, "hour"), base],
+        )
+        data.handle()
+        self.assertEqual(len(hours), 2)
+
+        minutes.append({"datetime": datetime(2021, 1, 1, 12), "volume": 1})
+        data.handle()
+        self.assertListEqual([e["datetime"].hour for e in hours], [9, 10, 11])
+        self.assertEqual(hours[-1]["volume"], 10)
+
+    def test_resample_offset(self):
+        hours = DictList(name="hours")
+        days = DictList(name="days")
+        base = LinkedDictList.Node(hours, [])
+        data = LinkedDictList(
+            "datetime",
+            [
+                LinkedDictList.Resample(
+                    days, [], base, "day", offset=timedelta(hours=9)
+                ),
+                base,
+            ],
+        )
+
+        hours.extend(
+            {"datetime": datetime(2021, 1, 1, 8) + timedelta(hours=h), "volume": 1}
+            for h in range(27)
+        )
+        data.handle()
+
+        self.assertListEqual(
+            [(e["datetime"], e["volume"]) for e in days],
+            [(datetime(2020, 12, 31, 9), 1), (datetime(2021, 1, 1, 9), 24)],
+        )
+
+        with self.assertRaises(ValueError):
+            LinkedDictList.Resample(DictList(), [], base, "week")
+
+    def test_profile(self):
+        global count
+        count = 0
+
+        first = DictList(name="first")
+        second = DictList(name="second")
+        data = LinkedDictList(
+            "datetime",
+            [
+                LinkedDictList.Node(first, [_count]),
+                LinkedDictList.Node(second, [_count]),
+            ],
+            [lambda e, p: None],
+            profile=True,
+        )
+
+        first.append({"datetime": datetime(2021, 1, 1)})
+        second.append({"datetime": datetime(2021, 2, 1)})
+        second.append({"datetime": datetime(2021, 3, 1)})
+
+        data.handle()
+
+        self.assertListEqual(
+            [(s["name"], s["count"]) for s in data.stats()],
+            [
+                ("node[0]", 1),
+                ("node[0]._count", 1),
+                ("node[1]", 2),
+                ("node[1]._count", 2),
+                ("<lambda>", 2),
+            ],
+        )
+        self.assertEqual(second[1]["count"], 2)
+
+    def test_checkpoint(self):
+        global count
+        count = 0
+
+        first = DictList([{"datetime": datetime(2021, 1, 1)}], name="first")
+        data = LinkedDictList("datetime", [LinkedDictList.Node(first, [_count])])
+        data.handle()
+        data[0].pipe = {"count": 1}
+
+        file = mktemp()
+        data.checkpoint(file)
+
+        data = LinkedDictList("datetime", [LinkedDictList.Node(first, [_count])])
+        data.restore(file)
+        self.assertEqual(data[0].handled, 1)
+        self.assertEqual(data[0].pipe, {"count": 1})
+
+        first.append({"datetime": datetime(2021, 1, 2)})
+        data.handle()
+        self.assertListEqual([e["count"] for e in first], [0, 1])
+
+        with self.assertRaises(ValueError):
+            LinkedDictList("datetime", []).restore(file)
+
+        remove(file)
+
+    def test_checkpoint_retention(self):
+        global count
+        count = 0
+
+        source = [{"datetime": datetime(2021, 1, d)} for d in range(1, 11)]
+        first = DictList(deepcopy(source), name="first")
+        data = LinkedDictList(
+            "datetime", [LinkedDictList.Node(first, [_count], retention=3)]
+        )
+        data.handle()
+        self.assertEqual(data[0].handled, 3)
+
+        file = mktemp()
+        data.checkpoint(file)
+
+        # the owner reloads the full history
+        first = DictList(deepcopy(source), name="first")
+        data = LinkedDictList(
+            "datetime", [LinkedDictList.Node(first, [_count], retention=3)]
+        )
+        data.restore(file)
+        self.assertEqual(data[0].handled, 10)
+
+        first.append({"datetime": datetime(2021, 1, 11)})
+        data.handle()
+        self.assertEqual(count, 11)
+        self.assertListEqual([e.get("count") for e in first], [None, None, 10])
+
+        first = DictList(deepcopy(source[:5]), name="first")
+        data = LinkedDictList("datetime", [LinkedDictList.Node(first, [_count])])
+        with self.assertRaises(ValueError):
+            data.restore(file)
+
+        self.assertEqual(data[0].handled, 0)
+
+        remove(file)
+
 
 count = 0
 
@@ -6,6 +6,7 @@ from os.path import join, abspath, dirname
 from tempfile import mktemp
 
 from src.library.lib.Trace import Trace
+from src.library.lib.Math import Math
 from src.library.data.OrderedDictList import OrderedDictList
 from .test_DictList import (
     F_DICTLIST_DICTLIST,
@@ -281,6 +282,205 @@ class TestOrderedDictList(TestCase):
         self.assertIsInstance(data, list)
         self.assertEqual(len(data), 0)
 
+    def test_bound(self):
+        self.data_age_sorted.append({"name": "Alice", "age": 25})
+
+        self.assertEqual(self.data_age_sorted.lower_bound(25), 1)
+        self.assertEqual(self.data_age_sorted.upper_bound(25), 3)
+        self.assertEqual(self.data_age_sorted.lower_bound(20), 0)
+        self.assertEqual(self.data_age_sorted.upper_bound(40), 4)
+
+    def test_range(self):
+        view = self.data_age_sorted.range(23, 30)
+        self.assertEqual(len(view), 2)
+        self.assertListEqual([e for e in view], self.source_age_sorted[1:])
+        self.assertEqual(view[-1], {"name": "John", "age": 30})
+        self.assertListEqual(view[1:].get_data(), self.source_age_sorted[2:])
+        self.assertListEqual(view.get_values("name"), ["Jane", "John"])
+        self.assertListEqual(
+            self.data_age_sorted.range(end=25).get_data(),
+            self.source_age_sorted[:2],
+        )
+
+        data = OrderedDictList("age", deepcopy(self.source), columnar=True)
+        self.assertListEqual(data.range(23).get_data(), self.source_age_sorted[1:])
+        self.assertListEqual(data.range(23).get_values("age"), [25, 30])
+        self.assertListEqual(data.range(23).get_values("unknown"), [])
+
+    def test_windows(self):
+        data = OrderedDictList("time", [{"time": t, "value": t * t} for t in range(6)])
+
+        self.assertListEqual(
+            [[e["time"] for e in view] for view in data.windows(size=3, step=2)],
+            [[0, 1, 2], [2, 3, 4]],
+        )
+        self.assertListEqual(
+            [view.get_values("time") for view in data.windows(duration=2, step=3)],
+            [[0], [2, 3]],
+        )
+
+        windows = data.windows(
+            size=3,
+            aggregations={
+                "sum": ("value", "sum"),
+                "max": ("value", "max"),
+                "average": ("time", Math.average),
+            },
+        )
+        self.assertListEqual(
+            [aggregation for _, aggregation in windows],
+            [
+                {"sum": 5, "max": 4, "average": 1.0},
+                {"sum": 14, "max": 9, "average": 2.0},
+                {"sum": 29, "max": 16, "average": 3.0},
+                {"sum": 50, "max": 25, "average": 4.0},
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            data.windows()
+
+        for kwargs in ({"duration": 0}, {"size": 0}, {"size": 2, "step": 0}):
+            with self.assertRaises(ValueError):
+                data.windows(**kwargs)
+
+        with self.assertRaises(ValueError):
+            OrderedDictList([("time", "descending")]).windows(duration=2)
+
+        windows = data.windows(
+            size=3,
+            step=2,
+            aggregations={
+                "first": ("value", "first"),
+                "last": ("value", "last"),
+                "min": ("value", "min"),
+                "range": ("value", "range"),
+            },
+        )
+        self.assertListEqual(
+            [aggregation for _, aggregation in windows],
+            [
+                {"first": 0, "last": 4, "min": 0, "range": 4},
+                {"first": 4, "last": 16, "min": 4, "range": 12},
+            ],
+        )
+
+    def test_get_asof(self):
+        data = self.data_age_sorted
+
+        self.assertEqual(data.get_asof(27), {"name": "Jane", "age": 25})
+        self.assertEqual(data.get_asof(25), {"name": "Jane", "age": 25})
+        self.assertIsNone(data.get_asof(20))
+        self.assertEqual(data.get_asof(27, "forward"), {"name": "John", "age": 30})
+        self.assertIsNone(data.get_asof(31, OrderedDictList.Direction.FORWARD))
+        self.assertEqual(data.get_asof(28, "nearest"), {"name": "John", "age": 30})
+        self.assertEqual(data.get_asof(20, "nearest"), {"name": "Doe", "age": 22})
+        self.assertIsNone(data.get_asof(28, tolerance=2))
+        self.assertEqual(data.get_asof(27, tolerance=2), {"name": "Jane", "age": 25})
+
+        with self.assertRaises(ValueError):
+            data.get_asof(27, "sideways")
+
+    def test_asof_join(self):
+        quotes = OrderedDictList(
+            "time", [{"time": 1, "price": 10}, {"time": 5, "price": 11}]
+        )
+        trades = OrderedDictList(
+            "time",
+            [{"time": 0, "qty": 1}, {"time": 3, "qty": 2}, {"time": 5, "qty": 3}],
+        )
+
+        self.assertListEqual(
+            trades.asof_join(quotes),
+            [
+                {"time": 0, "qty": 1},
+                {"time": 3, "qty": 2, "price": 10},
+                {"time": 5, "qty": 3, "price": 11},
+            ],
+        )
+        self.assertListEqual(
+            [e.get("price") for e in trades.asof_join(quotes, "forward")],
+            [10, 11, 11],
+        )
+        self.assertListEqual(
+            [e.get("price") for e in trades.asof_join(quotes, "nearest", 1)],
+            [10, None, 11],
+        )
+
+    def test_composite(self):
+        source = [
+            {"code": code, "day": day, "price": code * 10 + day}
+            for day in range(3)
+            for code in (2, 1)
+        ]
+        data = OrderedDictList(["code", ("day", "descending")], deepcopy(source))
+
+        self.assertListEqual(
+            data.get_values(),
+            [(1, 2), (1, 1), (1, 0), (2, 2), (2, 1), (2, 0)],
+        )
+        self.assertEqual(data.get_element((2, 1)), {"code": 2, "day": 1, "price": 21})
+        self.assertListEqual(data.get_values("price"), [12, 11, 10, 22, 21, 20])
+        self.assertListEqual(
+            [e["price"] for e in data.get_data(1)],
+            [12, 11, 10],
+        )
+        self.assertListEqual(
+            [e["price"] for e in data.range((1, 1), (2, 2))],
+            [11, 10, 22],
+        )
+        self.assertEqual(data.lower_bound(2), 3)
+        self.assertEqual(data.upper_bound((1, 1)), 2)
+
+        data.append({"code": 1, "day": 5, "price": 15})
+        self.assertEqual(data[0], {"code": 1, "day": 5, "price": 15})
+
+        columns = OrderedDictList(
+            ["code", ("day", OrderedDictList.Order.DESCENDING)],
+            deepcopy(source),
+            columnar=True,
+        )
+        self.assertListEqual(columns.get_values("price"), [12, 11, 10, 22, 21, 20])
+        self.assertListEqual(
+            [e["price"] for e in columns.get_filtered_data(start=(1, 0), end=2)],
+            [10, 22, 21, 20],
+        )
+
+        self.assertEqual(data.get_asof((1, 1))["price"], 11)
+        self.assertEqual(data.get_asof((1, 1), "forward")["price"], 11)
+
+    def test_get_asof_composite(self):
+        data = OrderedDictList(
+            ["code", "t"],
+            [{"code": "A", "t": 1}, {"code": "A", "t": 5}, {"code": "B", "t": 10}],
+        )
+
+        self.assertIsNone(data.get_asof(("B", 3)))
+        self.assertEqual(data.get_asof(("B", 3), "forward")["t"], 10)
+        self.assertEqual(data.get_asof(("A", 7))["t"], 5)
+        self.assertIsNone(data.get_asof(("A", 7), "forward"))
+        self.assertEqual(data.get_asof(("A", 4), "nearest")["t"], 5)
+        self.assertEqual(data.get_asof(("A", 2), "nearest")["t"], 1)
+        self.assertIsNone(data.get_asof(("A", 8), tolerance=2))
+        self.assertEqual(data.get_asof(("A", 6), tolerance=2)["t"], 5)
+
+        trades = OrderedDictList(
+            ["code", "t"],
+            [{"code": "A", "t": 7, "trade": 0}, {"code": "B", "t": 3, "trade": 1}],
+        )
+        self.assertListEqual(
+            trades.asof_join(data),
+            [{"code": "A", "t": 7, "trade": 0}, {"code": "B", "t": 3, "trade": 1}],
+        )
+        self.assertListEqual(
+            trades.asof_join(data, "forward"),
+            [{"code": "A", "t": 7, "trade": 0}, {"code": "B", "t": 3, "trade": 1}],
+        )
+
+        data.append({"code": "B", "t": 2, "price": 20})
+        self.assertEqual(trades.asof_join(data)[1]["price"], 20)
+        self.assertNotIn("price", trades.asof_join(data, "forward")[1])
+
     def test_get_values(self):
         names = self.data_name_sorted.get_values()
         self.assertIn("John", names)
@@ -304,10 +504,58 @@ class TestOrderedDictList(TestCase):
         self.assertEqual(data[0], self.data_name_sorted[0])
         self.assertEqual(data[1], self.data_name_sorted[1])
 
+    def test_extend_presorted(self):
+        for columnar in (False, True):
+            data = OrderedDictList(
+                "value",
+                [{"value": v, "order": 0} for v in range(0, 3000, 2)],
+                columnar=columnar,
+            )
+            data.extend(
+                [{"value": v, "order": 1} for v in range(2000, 4000, 3)],
+                presorted=True,
+            )
+            data.extend([{"value": v, "order": 2} for v in range(4000, 4010)], True)
+
+            values = [(e["value"], e["order"]) for e in data]
+            self.assertListEqual(values, sorted(values))
+            self.assertEqual(len(data), 1500 + 667 + 10)
+
+            data = OrderedDictList(
+                "k", [{"k": k} for k in range(0, 8, 2)], columnar=columnar
+            )
+            data.extend([{"k": 7}, {"k": 3}], presorted=True)
+            self.assertListEqual(data.get_values(), [0, 2, 3, 4, 6, 7])
+            self.assertEqual(data.get_element(3), {"k": 3})
+            self.assertEqual(data.get_element(7), {"k": 7})
+
     def test_insert(self):
         element = {"name": "Charlie", "age": 20}
-        with self.assertRaises(TypeError):
-            self.data_name_sorted.insert(element, index=1)
+        self.data_name_sorted.insert(element, index=1)
+        self.assertEqual(self.data_name_sorted[0], element)
+
+    def test_append_remove(self):
+        data = OrderedDictList("value")
+        source = [{"value": randint(0, 100), "order": i} for i in range(5000)]
+
+        for element in source:
+            data.append(element)
+
+        source.sort(key=lambda e: e["value"])
+        self.assertListEqual(data.get_data(), source)
+        self.assertEqual(data[2500], source[2500])
+        self.assertListEqual(data[1000:1010], source[1000:1010])
+
+        for element in source[::2]:
+            data.remove(element)
+
+        self.assertListEqual([e for e in data], source[1::2])
+        self.assertEqual(data.pop(-1), source[-1])
+        self.assertEqual(len(data), 2499)
+
+        data.evict(1200)
+        self.assertListEqual(data.get_data(), source[1::2][1200:-1])
+        self.assertEqual(data.lower_bound(source[1::2][1200]["value"]), 0)
 
     def test_remove(self):
         element = {"name": "John", "age": 30}
@@ -323,6 +571,84 @@ class TestOrderedDictList(TestCase):
         self.data_name_sorted.clear()
         self.assertEqual(len(self.data_name_sorted._data), 0)
 
+    def test_indexes(self):
+        data = OrderedDictList("name", deepcopy(self.source), indexes=["age"])
+        data.append({"name": "Alice", "age": 25})
+
+        self.assertEqual(data.get_element("age", 25), {"name": "Alice", "age": 25})
+        self.assertListEqual(
+            data.get_data({"age": 25}),
+            [{"name": "Alice", "age": 25}, {"name": "Jane", "age": 25}],
+        )
+
+        data.remove({"name": "Alice", "age": 25})
+        self.assertEqual(data.get_element("age", 25), {"name": "Jane", "age": 25})
+
+    def test_columnar(self):
+        data = OrderedDictList("age", deepcopy(self.source), columnar=True)
+        self.assertTrue(data.columnar)
+        self.assertListEqual([e for e in data], self.source_age_sorted)
+        self.assertListEqual(data.get_column("age").tolist(), [22, 25, 30])
+        self.assertEqual(data.get_element(25), {"name": "Jane", "age": 25})
+
+        data.append({"name": "Alice", "age": 24})
+        self.assertEqual(data[1], {"name": "Alice", "age": 24})
+        self.assertListEqual(data.get_values(), [22, 24, 25, 30])
+
+        data = OrderedDictList("name", columnar=True)
+        self.assertListEqual([e for e in data], [])
+
+    def test_columns_file(self):
+        file = mktemp()
+        self.data_age_sorted.write(file, OrderedDictList.FileType.COLUMNS)
+
+        data = OrderedDictList(
+            "age", file, OrderedDictList.FileType.COLUMNS, columnar=True
+        )
+        self.assertListEqual([e for e in data], self.source_age_sorted)
+        self.assertIsInstance(data.get_column("age"), memoryview)
+
+        data = OrderedDictList("name", file, OrderedDictList.FileType.COLUMNS)
+        self.assertListEqual([e for e in data], self.source_name_sorted)
+        remove(file)
+
+    def test_flush(self):
+        file = mktemp()
+        data = OrderedDictList("age", deepcopy(self.source))
+        data.flush(file, OrderedDictList.FileType.JSONL)
+
+        data.append({"name": "Smith", "age": 40})
+        data.flush(file, OrderedDictList.FileType.JSONL)
+        self.assertEqual(data._journal["frames"], 1)
+
+        data.append({"name": "Alice", "age": 24})
+        data.flush(file, OrderedDictList.FileType.JSONL)
+        self.assertEqual(data._journal["frames"], 0)
+
+        with open(file, "r", encoding="UTF-8-sig") as f:
+            self.assertListEqual(
+                [e for e in OrderedDictList._iter_jsonl(f)],
+                data.get_data(),
+            )
+
+        remove(file)
+
+    def test_flush_extend_generator(self):
+        file = mktemp()
+        data = OrderedDictList("k", [{"k": 0}, {"k": 1}])
+        data.flush(file, OrderedDictList.FileType.JSONL)
+
+        data.extend({"k": k} for k in range(2, 5))
+        self.assertListEqual(data.get_values(), [0, 1, 2, 3, 4])
+
+        data.flush(file, OrderedDictList.FileType.JSONL)
+        with open(file, "r", encoding="UTF-8-sig") as f:
+            self.assertListEqual(
+                [e for e in OrderedDictList._iter_jsonl(f)], data.get_data()
+            )
+
+        remove(file)
+
     def test_read(self):
         data = OrderedDictList("name")
         data.read(F_DICTLIST_DICTLIST)
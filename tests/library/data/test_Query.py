@@ -0,0 +1,92 @@
+from unittest import TestCase
+from copy import deepcopy
+
+from src.library.data.DictList import DictList
+from src.library.data.OrderedDictList import OrderedDictList
+from src.library.data.Query import Query
+
+
+col = Query.col
+
+
+class TestQuery(TestCase):
+    def setUp(self):
+        self.source = [
+            {"name": "John", "age": 30, "city": "Seoul"},
+            {"name": "Jane", "age": 25, "city": "Busan"},
+            {"name": "Doe", "age": 22},
+            {"name": "Smith", "age": 40, "city": "Seoul"},
+        ]
+        self.data = [
+            DictList(deepcopy(self.source)),
+            DictList(deepcopy(self.source), columnar=True),
+            DictList(deepcopy(self.source), indexes=["name", "city"]),
+        ]
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            Query()
+
+    def test_compare(self):
+        for data in self.data:
+            self.assertListEqual(data.query(col("age") > 25), [data[0], data[3]])
+            self.assertListEqual(
+                data.query(col("age") >= 25), [data[0], data[1], data[3]]
+            )
+            self.assertListEqual(data.query(col("age") < 25), [data[2]])
+            self.assertListEqual(data.query(col("age") <= 25), [data[1], data[2]])
+            self.assertListEqual(data.query(col("name") == "Doe"), [data[2]])
+            self.assertListEqual(data.query(col("city") != "Seoul"), [data[1]])
+            self.assertListEqual(data.query(col("city") == "Daegu"), [])
+
+    def test_isin(self):
+        for data in self.data:
+            self.assertListEqual(
+                data.query(col("name").isin(["Jane", "Smith", "Theodore"])),
+                [data[1], data[3]],
+            )
+            self.assertListEqual(data.query(col("city").isin([])), [])
+
+    def test_between(self):
+        for data in self.data:
+            self.assertListEqual(data.query(col("age").between(22, 25)), data[1:3])
+
+    def test_exists(self):
+        for data in self.data:
+            self.assertListEqual(
+                data.query(col("city").exists()), [data[0], data[1], data[3]]
+            )
+            self.assertListEqual(data.query(~col("city").exists()), [data[2]])
+
+    def test_combine(self):
+        for data in self.data:
+            self.assertListEqual(
+                data.query((col("city") == "Seoul") & (col("age") < 35)),
+                [data[0]],
+            )
+            self.assertListEqual(
+                data.query((col("age") < 23) | (col("name") == "Jane")),
+                [data[1], data[2]],
+            )
+            self.assertListEqual(
+                data.query(~((col("city") == "Seoul") | (col("age") < 23))),
+                [data[1]],
+            )
+
+    def test_match(self):
+        query = (col("city") == "Seoul") & ~(col("age") > 35)
+        self.assertListEqual(
+            [e for e in self.source if query.match(e)],
+            [self.source[0]],
+        )
+
+    def test_ordered(self):
+        data = OrderedDictList("age", deepcopy(self.source), indexes=["city"])
+        self.assertListEqual(
+            data.query(col("city") == "Seoul"),
+            [self.source[0], self.source[3]],
+        )
+        self.assertListEqual(
+            data.query(col("age") < 30),
+            [self.source[2], self.source[1]],
+        )
@@ -71,6 +71,24 @@ class TestInterval(TestCase):
 
         remove(file)
 
+    def test_file_journal(self):
+        file = mktemp()
+
+        interval = Interval({0.01: 2}, file)
+        for _ in range(10):
+            interval.wait()
+
+        self.assertLessEqual(len(interval._records), 4)
+
+        interval = Interval({0.01: 2}, file)
+        self.assertEqual(len(interval._values[0]["records"]), 2)
+        self.assertListEqual(
+            interval._values[0]["records"],
+            interval._records.get_values("time")[-2:],
+        )
+
+        remove(file)
+
     def test_simplified_init(self):
         interval = Interval(1.00)
         self.assertIsInstance(interval, Interval)
@@ -1,6 +1,9 @@
 from unittest import TestCase
+from array import array
 from multiprocessing import cpu_count
+from multiprocessing.shared_memory import SharedMemory
 from random import randint
+from time import process_time, sleep
 
 from src.library.lib.Trace import Trace
 from src.library.lib.Process import Process
@@ -67,6 +70,134 @@ class TestProcess(TestCase):
 
         self.assertListEqual(outputs, [])
 
+        results = self.process.execute(_add, bundles, unit=1000, batch=7, silent=True)
+        self.assertEqual(len(self.process.execute(_add, bundles[:10], 5, True)), 10)
+        self.assertEqual(len(results), len(bundles))
+        self.assertListEqual(
+            sorted(results),
+            sorted(_add(*bundle.args, **bundle.kwargs) for bundle in bundles),
+        )
+
+    def test_execute_idle(self):
+        process = Process(count=2)
+        bundles = [Process.Bundle(0.01) for _ in range(40)]
+
+        start = process_time()
+        results = process.execute(_sleep, bundles, unit=5, silent=True)
+
+        self.assertListEqual(results, [0.01] * 40)
+        self.assertLess(process_time() - start, 0.1)
+
+        del process
+
+    def test_imap(self):
+        process = Process(count=2)
+        bundles = [Process.Bundle(i, 0, c=0, d=0) for i in range(1000)]
+
+        self.assertListEqual(
+            list(process.imap(_add, bundles, unit=7, silent=True)), list(range(1000))
+        )
+        self.assertListEqual(
+            sorted(process.imap(_add, bundles, unit=7, ordered=False, silent=True)),
+            list(range(1000)),
+        )
+
+        results = process.imap(_add, bundles, unit=7, batch=2, silent=True)
+        self.assertListEqual([next(results) for _ in range(10)], list(range(10)))
+        results.close()
+
+        self.assertListEqual(
+            process.execute(_add, bundles[:10], silent=True), list(range(10))
+        )
+
+        del process
+
+    def test_execute_auto(self):
+        process = Process(count=2)
+        bundles = [Process.Bundle(i, 0, c=0, d=0) for i in range(10000)]
+
+        self.assertListEqual(
+            sorted(process.execute(_add, bundles, unit="auto", silent=True)),
+            list(range(10000)),
+        )
+        self.assertListEqual(
+            list(process.imap(_add, bundles, unit="auto", silent=True)),
+            list(range(10000)),
+        )
+
+        with self.assertRaises(ValueError):
+            process.execute(_add, bundles, unit="fixed", silent=True)
+
+        with self.assertRaises(ValueError):
+            process.execute(_add, bundles, unit=0, silent=True)
+
+        for batch in (0, -1):
+            with self.assertRaises(ValueError):
+                process.execute(_add, bundles, silent=True, batch=batch)
+
+        with self.assertRaises(ValueError):
+            process.execute(lambda a, b, c, d: a, bundles, silent=True)
+
+        self.assertEqual(len(process.execute(_add, bundles, silent=True)), 10000)
+
+        del process
+
+    def test_shared(self):
+        process = Process(count=2)
+        bundles = [
+            Process.Bundle(Process.Shared(array("d", range(i, i + 1000))))
+            for i in range(10)
+        ]
+
+        results = process.execute(_square, bundles, unit=1, silent=True)
+        self.assertListEqual(
+            sorted(result.data.tolist() for result in results),
+            [[float(v * v) for v in range(i, i + 1000)] for i in range(10)],
+        )
+
+        names = [result._memory.name for result in results]
+        del results
+
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name)
+
+        shared = Process.Shared(array("d", range(1000)))
+        results = process.execute(
+            _total, [Process.Bundle(shared) for _ in range(20)], unit=1, silent=True
+        )
+        self.assertListEqual(results, [float(sum(range(1000)))] * 20)
+        self.assertEqual(shared.data[999], 999.0)
+
+        name = shared._memory.name
+        shared.close()
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name)
+
+        with self.assertRaises(TypeError):
+            Process.Shared([1, 2, 3])
+
+        shared = Process.Shared(b"")
+        self.assertEqual(bytes(shared.data), b"")
+
+        shared = Process.Shared(array("i", [1, 2, 3]))
+        self.assertListEqual(shared.data.tolist(), [1, 2, 3])
+
+        del process
+
+
+def _sleep(seconds: float) -> float:
+    sleep(seconds)
+    return seconds
+
+
+def _total(shared: Process.Shared) -> float:
+    return sum(shared.data)
+
+
+def _square(shared: Process.Shared) -> Process.Shared:
+    return Process.Shared(array("d", (v * v for v in shared.data)))
+
 
 def _add(a: int, b: int, c: int, d: int) -> int:
     return a + b + c + d
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from src.library.lib.Profile import Profile
+
+
+class TestProfile(TestCase):
+    def test_call(self):
+        profile = Profile(_double)
+        self.assertEqual(profile.name, "_double")
+        self.assertEqual(profile(2), 4)
+
+        stats = profile.get()
+        self.assertEqual(stats["name"], "_double")
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(stats["p50"], stats["total"])
+
+    def test_add(self):
+        profile = Profile(None, "node")
+        self.assertIsNone(profile.get()["p50"])
+
+        for time in range(10000):
+            profile.add(float(time))
+
+        stats = profile.get()
+        self.assertEqual(stats["count"], 10000)
+        self.assertEqual(stats["total"], sum(range(10000)))
+        self.assertEqual(stats["mean"], sum(range(10000)) / 10000)
+        self.assertLessEqual(len(profile._times), Profile.SIZE)
+        self.assertLess(stats["p50"], stats["p99"])
+
+
+def _double(value: int) -> int:
+    return value * 2